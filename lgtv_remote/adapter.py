@@ -1,16 +1,51 @@
-from pywebostv.connection import WebOSClient
+from pathlib import Path
+from threading import RLock
+from typing import Optional, Union, List, Dict, Callable, TYPE_CHECKING
 
 from lgtv_remote.exeception import ClientError
+from lgtv_remote.network import get_mac_address, get_broadcast_address
+from lgtv_remote.pool import WebOSClientPool
+from lgtv_remote.proxy import DaemonClient
 from lgtv_remote.settings import SettingsInterface
+from lgtv_remote.timings import Timings
 
+if TYPE_CHECKING:
+    from pywebostv.connection import WebOSClient
+
+
+REGISTER_TIMEOUT = 60
 
 class WebOSClientAdapter:
-    def __init__(self, settings: SettingsInterface):
+    def __init__(
+            self,
+            settings: SettingsInterface,
+            socket_path: Optional[str] = None,
+            timings: Optional[Timings] = None
+    ):
         self.settings = settings
+        self.socket_path = socket_path
+        self.timings = timings if timings is not None else Timings()
+        self._lock = RLock()
+
+    def create(self, path: str, friendly_name: str) -> Union['WebOSClient', DaemonClient]:
+        socket_path = self.socket_path
+
+        if socket_path and Path(socket_path).exists():
+            try:
+                with self.timings.phase('connect', friendly_name):
+                    return DaemonClient(socket_path, path, friendly_name)
+            except OSError:
+                pass
+        return self.connect(path, friendly_name)
 
-    def create(self, path: str, friendly_name: str) -> WebOSClient:
-        self.settings.load(path)
-        settings = self.settings.get(friendly_name)
+    def connect(self, path: str, friendly_name: str, timeout: Optional[float] = None) -> 'WebOSClient':
+        timings = self.timings
+
+        with timings.phase('import'):
+            from pywebostv.connection import WebOSClient
+        with self._lock, timings.phase('settings'):
+            self.settings.load(path)
+            settings = self.settings.get(friendly_name)
         try:
             host = settings.host
         except KeyError:
@@ -21,18 +56,80 @@ class WebOSClientAdapter:
             raise ClientError('Missing client key. Please authenticate with your TV.') from None
 
         client = WebOSClient(host)
-        client.connect()
-        status = client.register(store)
-        if not all([s == WebOSClient.REGISTERED for s in status]):
+        with timings.phase('connect', friendly_name):
+            client.sock.settimeout(timeout)
+            client.connect()
+            client.sock.settimeout(None)
+        try:
+            with timings.phase('register', friendly_name):
+                statuses = client.register(store, timeout if timeout is not None else REGISTER_TIMEOUT)
+                registered = all([s == WebOSClient.REGISTERED for s in statuses])
+        except Exception as e:
+            self._close(client)
+            raise ClientError(f'Error registering with TV {host}: {e}') from None
+        if not registered:
+            self._close(client)
             raise ClientError(f'Error connecting to TV {host}. Please authenticate again.')
         return client
 
-    def discover(self):
-        devices = WebOSClient.discover()
-        for device in devices:
-            print(device.host)
+    def release(self, path: str, friendly_name: str, client: Union['WebOSClient', DaemonClient]):
+        pass
+
+    def discard(self, path: str, friendly_name: str):
+        pass
+
+    def resolve(self, path: str, names: Optional[List[str]]) -> List[Optional[str]]:
+        if not names:
+            return [None]
+        with self._lock, self.timings.phase('settings'):
+            self.settings.load(path)
+            return self.settings.resolve(names)
+
+    def get_macro(self, path: str, name: str) -> List:
+        with self._lock, self.timings.phase('settings'):
+            self.settings.load(path)
+            return self.settings.get_macro(name)
+
+    def find(
+            self,
+            timeout: float = 5,
+            refresh: bool = False,
+            on_host: Optional[Callable[[str, str], None]] = None
+    ) -> Dict[str, str]:
+        import asyncio
+
+        from lgtv_remote.discovery import DiscoveryCache, discover
+
+        cache = DiscoveryCache()
+        hosts = None if refresh else cache.get()
+        if hosts is None:
+            hosts = asyncio.run(discover(timeout, on_host=on_host))
+            hosts and cache.set(hosts)
+        elif on_host is not None:
+            for host, location in hosts.items():
+                on_host(host, location)
+        return hosts
+
+    def discover(self, timeout: float = 5, refresh: bool = False):
+        self.find(timeout, refresh, lambda host, _: print(host, flush=True))
+
+    def probe(self, path: str, timeout: float = 5, refresh: bool = False) -> List[Dict[str, str]]:
+        import asyncio
+
+        from lgtv_remote.aio import AsyncWebOSClientAdapter
+
+        async def probe():
+            adapter = AsyncWebOSClientAdapter(self.settings)
+            try:
+                return await adapter.probe(path, timeout, refresh)
+            finally:
+                await adapter.close()
+
+        return asyncio.run(probe())
 
     def authenticate(self, friendly_name: str, host: str, path: str):
+        from pywebostv.connection import WebOSClient
+
         settings = self.settings
         store = {}
         friendly_name = friendly_name or host
@@ -48,5 +145,40 @@ class WebOSClientAdapter:
         if 'client_key' not in store:
             raise ClientError(f'Client key not retrieved from TV {host}.')
         client_key = store['client_key']
-        settings.set(friendly_name, host, client_key)
+        Path(path).exists() and settings.load(path)
+        settings.set(friendly_name, host, client_key, get_mac_address(host), get_broadcast_address(host))
         settings.serialize(path)
+
+    @staticmethod
+    def _close(client: 'WebOSClient'):
+        try:
+            client.close()
+        except (OSError, RuntimeError):
+            pass
+
+
+class PooledWebOSClientAdapter(WebOSClientAdapter):
+    def __init__(
+            self,
+            settings: SettingsInterface,
+            socket_path: Optional[str] = None,
+            pool: Optional[WebOSClientPool] = None,
+            timings: Optional[Timings] = None
+    ):
+        super().__init__(settings, socket_path, timings)
+        self.pool = pool if pool is not None else WebOSClientPool()
+
+    def connect(self, path: str, friendly_name: str, timeout: Optional[float] = None) -> 'WebOSClient':
+        pool = self.pool
+        connect = super().connect
+
+        return pool.acquire((str(path), friendly_name), lambda: connect(path, friendly_name, timeout))
+
+    def release(self, path: str, friendly_name: str, client: Union['WebOSClient', DaemonClient]):
+        self.pool.release((str(path), friendly_name), client)
+
+    def discard(self, path: str, friendly_name: str):
+        self.pool.discard((str(path), friendly_name))
+
+    def close(self):
+        self.pool.close()
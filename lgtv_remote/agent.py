@@ -5,6 +5,8 @@ from pynput.mouse import Listener as MouseListener, Button, Controller as MouseC
 
 from pywebostv.controls import WebOSControlBase
 
+from lgtv_remote.stream import PointerStream, TextStream, InputStreamStats
+
 
 class BlockingWindow(Tk):
     def __init__(self, mouse: MouseController):
@@ -75,28 +77,36 @@ class BlockingWindow(Tk):
 
 
 class MouseAgent:
-    def __init__(self, input_control: WebOSControlBase, blocking_window: BlockingWindow):
+    def __init__(self, input_control: WebOSControlBase, blocking_window: BlockingWindow, rate: float = 60):
         self._input_control = input_control
         self._blocking_window = blocking_window
+        self._pointer_stream = PointerStream(input_control, rate)
+
+    @property
+    def stats(self) -> InputStreamStats:
+        return self._pointer_stream.stats
 
     def listen(self):
         blocking_window = self._blocking_window
         input_control = self._input_control
+        pointer_stream = self._pointer_stream
 
         with self._create_listener() as listener:
             input_control.connect_input()
             input_control.move(0, 0, block=True)
+            pointer_stream.start()
             listener.join()
+            pointer_stream.stop()
             input_control.disconnect_input()
 
         blocking_window.destroy()
 
     def on_click(self, x, y, button, pressed):
-        input_control = self._input_control
+        pointer_stream = self._pointer_stream
 
         if button == Button.right:
             return False
-        pressed and input_control.click(block=True)
+        pressed and pointer_stream.click()
 
     def on_move(self, x, y):
         blocking_window = self._blocking_window
@@ -111,30 +121,38 @@ class MouseAgent:
 
     def _move_mouse(self, x, y):
         blocking_window = self._blocking_window
-        input_control = self._input_control
+        pointer_stream = self._pointer_stream
         current_x = blocking_window.current_x
         current_y = blocking_window.current_y
 
         relative_x = x - current_x
         relative_y = y - current_y
 
-        input_control.move(relative_x, relative_y, block=True)
+        pointer_stream.move(relative_x, relative_y)
         blocking_window.current_x = x
         blocking_window.current_y = y
 
 
 class KeyboardAgent:
-    def __init__(self, input_control: WebOSControlBase, blocking_window: BlockingWindow):
+    def __init__(self, input_control: WebOSControlBase, blocking_window: BlockingWindow, interval: float = 0.03):
         self._input_control = input_control
         self._blocking_window = blocking_window
+        self._text_stream = TextStream(input_control, interval)
+
+    @property
+    def stats(self) -> InputStreamStats:
+        return self._text_stream.stats
 
     def listen(self):
         mouse_listener = self._create_mouse_listener()
         blocking_window = self._blocking_window
+        text_stream = self._text_stream
 
         mouse_listener.start()
+        text_stream.start()
         with self._create_keyboard_listener() as keyboard_listener:
             keyboard_listener.join()
+        text_stream.stop()
         mouse_listener.stop()
         blocking_window.destroy()
 
@@ -145,16 +163,16 @@ class KeyboardAgent:
             blocking_window.enforce_boundary(x, y)
 
     def on_press(self, key):
-        input_control = self._input_control
+        text_stream = self._text_stream
 
         if isinstance(key, KeyCode):
-            input_control.type(key.char, block=True)
+            key.char and text_stream.type(key.char)
         elif key == Key.backspace:
-            input_control.delete(1, block=True)
+            text_stream.delete(1)
         elif key == Key.space:
-            input_control.type(' ', block=True)
+            text_stream.type(' ')
         elif key == Key.enter:
-            input_control.enter(block=True)
+            text_stream.enter()
         elif key == Key.esc:
             return False
 
@@ -0,0 +1,338 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import Dict, Optional, Callable, Type, AsyncIterator, List, Tuple, TYPE_CHECKING
+from uuid import uuid4
+
+from lgtv_remote.discovery import DiscoveryCache, discover, describe
+from lgtv_remote.exeception import ClientError
+from lgtv_remote.network import get_mac_address, get_broadcast_address
+from lgtv_remote.settings import SettingsInterface
+
+if TYPE_CHECKING:
+    from pywebostv.controls import WebOSControlBase
+
+
+class AsyncWebOSClient:
+    PROMPTED = 1
+    REGISTERED = 2
+
+    def __init__(self, host: str, secure: bool = False):
+        self.host = host
+        self.url = f'wss://{host}:3001/' if secure else f'ws://{host}:3000/'
+        self._connection = None
+        self._reader: Optional[asyncio.Task] = None
+        self._waiters: Dict[str, Callable[[Dict], None]] = {}
+
+    @property
+    def terminated(self) -> bool:
+        return self._reader is None or self._reader.done()
+
+    async def connect(self):
+        self._connection = await connect_websocket(self.url)
+        self._reader = asyncio.ensure_future(self._read())
+
+    async def close(self):
+        if self._connection is not None:
+            await self._connection.close()
+        if self._reader is not None:
+            await asyncio.gather(self._reader, return_exceptions=True)
+
+    async def register(self, store: Dict, timeout: float = 60) -> AsyncIterator[int]:
+        from pywebostv.connection import REGISTRATION_PAYLOAD
+
+        payload = dict(REGISTRATION_PAYLOAD)
+        if 'client_key' in store:
+            payload['client-key'] = store['client_key']
+        queue = asyncio.Queue()
+        unique_id = await self.send_message('register', None, payload, callback=queue.put_nowait)
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    raise ClientError(f'Timed out registering with TV {self.host}.') from None
+                if item.get('payload', {}).get('pairingType') == 'PROMPT':
+                    yield self.PROMPTED
+                elif item.get('type') == 'registered':
+                    store['client_key'] = item['payload']['client-key']
+                    yield self.REGISTERED
+                    break
+                else:
+                    raise ClientError(f'Failed to register with TV {self.host}.')
+        finally:
+            self._waiters.pop(unique_id, None)
+
+    async def send_message(
+            self,
+            request_type: str,
+            uri: Optional[str],
+            payload: Optional[Dict],
+            unique_id: Optional[str] = None,
+            callback: Optional[Callable[[Dict], None]] = None
+    ) -> str:
+        unique_id = unique_id or str(uuid4())
+        message = {'type': request_type, 'id': unique_id}
+        if uri is not None:
+            message['uri'] = uri
+        if payload is not None:
+            message['payload'] = payload
+
+        if callback is not None:
+            self._waiters[unique_id] = callback
+        if self.terminated:
+            raise ClientError(f'Connection to TV {self.host} is closed.')
+        await self._connection.send(json.dumps(message))
+        return unique_id
+
+    async def request(self, uri: str, payload: Optional[Dict] = None, timeout: float = 60) -> Dict:
+        future = asyncio.get_running_loop().create_future()
+        unique_id = await self.send_message(
+            'request',
+            uri,
+            payload,
+            callback=lambda message: future.done() or future.set_result(message)
+        )
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise ClientError(f'Timed out waiting for a response to {uri}.') from None
+        finally:
+            self._waiters.pop(unique_id, None)
+
+    async def _read(self):
+        waiters = self._waiters
+
+        async for data in self._connection:
+            try:
+                message = json.loads(data)
+            except ValueError:
+                continue
+            callback = waiters.get(message.get('id'))
+            if callback is not None:
+                callback(message)
+
+
+class AsyncControl:
+    def __init__(self, client: AsyncWebOSClient, control_type: Type['WebOSControlBase']):
+        self.client = client
+        self.control_type = control_type
+        self._input_connection = None
+
+    def __getattr__(self, name: str):
+        control_type = self.control_type
+
+        if name in getattr(control_type, 'INPUT_COMMANDS', {}):
+            return self._create_input_command(control_type.INPUT_COMMANDS[name])
+        if name in control_type.COMMANDS:
+            return self._create_command(control_type.COMMANDS[name])
+        raise AttributeError(name)
+
+    async def connect_input(self):
+        response = await self.client.request('ssap://com.webos.service.networkinput/getPointerInputSocket')
+        socket_path = response.get('payload', {}).get('socketPath')
+        if not socket_path:
+            raise ClientError('Unable to connect to mouse.')
+        self._input_connection = await connect_websocket(socket_path)
+
+    async def send_input(self, payload: str):
+        if self._input_connection is None:
+            raise ClientError('Input is not connected.')
+        await self._input_connection.send(payload)
+
+    async def disconnect_input(self):
+        if self._input_connection is not None:
+            await self._input_connection.close()
+            self._input_connection = None
+
+    def _create_command(self, command_info: Dict) -> Callable:
+        from pywebostv.controls import process_payload
+
+        client = self.client
+
+        async def request(*args, **kwargs):
+            kwargs.pop('block', None)
+            timeout = kwargs.pop('timeout', 60)
+            params = process_payload(command_info.get('payload'), *args, **kwargs)
+            response = await client.request(command_info['uri'], params, timeout)
+            if response.get('type') == 'error':
+                raise IOError(response.get('error', 'Unknown Communication Error'))
+            payload = response.get('payload')
+            status, message = command_info.get('validation', lambda p: (True, None))(payload)
+            if not status:
+                raise IOError(message)
+            return command_info.get('return', lambda p: p)(payload)
+
+        return request
+
+    def _create_input_command(self, command_info: Dict) -> Callable:
+        from pywebostv.controls import process_payload
+
+        async def request(*args, **kwargs):
+            kwargs.pop('block', None)
+            params = process_payload(command_info['command'], *args, **kwargs)
+            await self.send_input('\n'.join(':'.join(str(y) for y in x) for x in params) + '\n\n')
+
+        return request
+
+
+class AsyncWebOSClientAdapter:
+    def __init__(self, settings: SettingsInterface):
+        self.settings = settings
+        self._sessions: Dict[Tuple[str, Optional[str]], AsyncWebOSClient] = {}
+        self._connecting: Dict[Tuple[str, Optional[str]], asyncio.Future] = {}
+
+    async def create(self, path: str, friendly_name: str) -> AsyncWebOSClient:
+        key = (str(path), friendly_name)
+        client = self._sessions.get(key)
+        if client is not None and not client.terminated:
+            return client
+        connecting = self._connecting.get(key)
+        if connecting is None:
+            connecting = asyncio.ensure_future(self._connect(key, path, friendly_name))
+            connecting.add_done_callback(lambda task: task.cancelled() or task.exception())
+            self._connecting[key] = connecting
+        return await asyncio.shield(connecting)
+
+    async def _connect(self, key: Tuple[str, Optional[str]], path: str, friendly_name: str) -> AsyncWebOSClient:
+        try:
+            client = await self.connect(path, friendly_name)
+        finally:
+            self._connecting.pop(key, None)
+        self._sessions[key] = client
+        return client
+
+    async def connect(self, path: str, friendly_name: str) -> AsyncWebOSClient:
+        settings = self.settings
+
+        settings.load(path)
+        tv_settings = settings.get(friendly_name)
+        store = {'client_key': tv_settings.client_key}
+        client = AsyncWebOSClient(tv_settings.host)
+        await client.connect()
+        statuses = []
+        try:
+            statuses = [status async for status in client.register(store)]
+        finally:
+            if AsyncWebOSClient.REGISTERED not in statuses:
+                await client.close()
+        if AsyncWebOSClient.REGISTERED not in statuses:
+            raise ClientError(f'Error connecting to TV {tv_settings.host}. Please authenticate again.')
+        return client
+
+    async def discard(self, path: str, friendly_name: str):
+        client = self._sessions.pop((str(path), friendly_name), None)
+        if client is not None:
+            await client.close()
+
+    def resolve(self, path: str, names: Optional[List[str]]) -> List[Optional[str]]:
+        if not names:
+            return [None]
+        self.settings.load(path)
+        return self.settings.resolve(names)
+
+    def get_macro(self, path: str, name: str) -> List:
+        self.settings.load(path)
+        return self.settings.get_macro(name)
+
+    async def find(
+            self,
+            timeout: float = 5,
+            refresh: bool = False,
+            on_host: Optional[Callable[[str, str], None]] = None
+    ) -> Dict[str, str]:
+        cache = DiscoveryCache()
+        hosts = None if refresh else cache.get()
+        if hosts is None:
+            hosts = await discover(timeout, on_host=on_host)
+            hosts and cache.set(hosts)
+        elif on_host is not None:
+            for host, location in hosts.items():
+                on_host(host, location)
+        return hosts
+
+    async def discover(self, timeout: float = 5, refresh: bool = False):
+        await self.find(timeout, refresh, lambda host, _: print(host, flush=True))
+
+    async def probe(self, path: str, timeout: float = 5, refresh: bool = False) -> List[Dict[str, str]]:
+        from pywebostv.controls import SystemControl
+        from websockets.exceptions import WebSocketException
+
+        settings = self.settings
+        names = {}
+        probes = []
+
+        if Path(path).exists():
+            settings.load(path)
+            names = {settings.get(name).host: name for name in settings.resolve(['all'])}
+
+        async def probe(host: str, location: str) -> Dict[str, str]:
+            name = names.get(host)
+            description = await describe(location, timeout)
+            row = {
+                'host': host,
+                'name': name or '',
+                'friendly_name': description.get('friendlyName', ''),
+                'model': description.get('modelName', ''),
+                'software': ''
+            }
+            if name is not None:
+                try:
+                    client = await asyncio.wait_for(self.create(path, name), timeout)
+                    info = await AsyncControl(client, SystemControl).info(timeout=timeout)
+                    row['model'] = info.get('model_name') or row['model']
+                    version = '.'.join(str(info[key]) for key in ('major_ver', 'minor_ver') if key in info)
+                    row['software'] = ' '.join(filter(None, (info.get('product_name'), version)))
+                except (OSError, ClientError, WebSocketException, asyncio.TimeoutError) as error:
+                    row['software'] = f'Error: {str(error) or "Timed out."}'
+            return row
+
+        def on_host(host: str, location: str):
+            probes.append(asyncio.ensure_future(probe(host, location)))
+
+        await self.find(timeout, refresh, on_host)
+        return sorted(await asyncio.gather(*probes), key=lambda row: row['host'])
+
+    async def authenticate(self, friendly_name: str, host: str, path: str):
+        settings = self.settings
+        store = {}
+        friendly_name = friendly_name or host
+
+        client = AsyncWebOSClient(host)
+        await client.connect()
+        prompted = False
+        try:
+            async for status in client.register(store):
+                if status == AsyncWebOSClient.PROMPTED:
+                    prompted = True
+        finally:
+            await client.close()
+        if not prompted:
+            raise ClientError(f'Unable to authenticate with TV {host}.')
+        if 'client_key' not in store:
+            raise ClientError(f'Client key not retrieved from TV {host}.')
+        Path(path).exists() and settings.load(path)
+        settings.set(friendly_name, host, store['client_key'], get_mac_address(host), get_broadcast_address(host))
+        settings.serialize(path)
+
+    async def close(self):
+        connecting = tuple(self._connecting.values())
+        for task in connecting:
+            task.cancel()
+        await asyncio.gather(*connecting, return_exceptions=True)
+        sessions = tuple(self._sessions.values())
+        self._sessions.clear()
+        await asyncio.gather(*(client.close() for client in sessions), return_exceptions=True)
+
+
+async def connect_websocket(url: str):
+    from websockets import connect
+
+    ssl_context = None
+    if url.startswith('wss://'):
+        import ssl
+
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+    return await connect(url, ssl=ssl_context, compression=None, max_size=None, ping_interval=None)
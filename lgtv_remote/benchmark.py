@@ -0,0 +1,274 @@
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+from io import StringIO
+from threading import Thread, Event
+from time import perf_counter, sleep, time
+from typing import Dict, List, Optional, Tuple
+
+from lgtv_remote.adapter import WebOSClientAdapter, PooledWebOSClientAdapter
+from lgtv_remote.client import Client
+from lgtv_remote.main import create_client
+from lgtv_remote.settings import Settings, MACROS_KEY
+from lgtv_remote.simulator import FakeTv, DEFAULT_CLIENT_KEY
+from lgtv_remote.timings import Timings
+
+
+DEFAULT_OUTPUT = 'benchmarks.jsonl'
+TV_NAME = 'benchmark'
+GROUPS = ('media', 'system', 'input')
+SKIPPED_COMMANDS = ('power-on', 'capture-mouse', 'capture-keyboard')
+COMMAND_ARGS = {
+    'set-volume': ['5'],
+    'notify': ['hello'],
+    'type': ['hello'],
+    'macro': [TV_NAME],
+    'keys': ['up', 'down', 'ok']
+}
+
+
+class FakeTvThread(Thread):
+    def __init__(self, tv: FakeTv):
+        super().__init__(name='lgtv-remote-fake-tv', daemon=True)
+        self.tv = tv
+        self.loop = asyncio.new_event_loop()
+        self._started = Event()
+        self._error: Optional[BaseException] = None
+
+    def start(self):
+        super().start()
+        self._started.wait()
+        if self._error is not None:
+            raise RuntimeError(f'Unable to start a fake TV on {self.tv.host}:{self.tv.port}: {self._error}')
+
+    def run(self):
+        loop = self.loop
+
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self.tv.start())
+        except OSError as e:
+            self._error = e
+        self._started.set()
+        if self._error is None:
+            loop.run_forever()
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self.tv.close(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.join()
+
+
+def measure_cold_start(path: str, runs: int) -> float:
+    command = [sys.executable, '-m', 'lgtv_remote.main', 'media', 'get-volume', '-n', TV_NAME, '-c', path]
+    durations = []
+    for _ in range(runs):
+        start = perf_counter()
+        process = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+        durations.append(perf_counter() - start)
+        if process.returncode or 'volume' not in process.stdout:
+            output = (process.stderr or process.stdout).strip().splitlines()
+            raise RuntimeError(f'Exited with code {process.returncode}: {output[-1] if output else "no output"}')
+    return statistics.median(durations) * 1000
+
+
+def measure_register(path: str, iterations: int) -> float:
+    adapter = WebOSClientAdapter(Settings())
+    durations = []
+    for _ in range(iterations):
+        start = perf_counter()
+        client = adapter.connect(path, TV_NAME)
+        durations.append(perf_counter() - start)
+        client.close()
+    return statistics.median(durations) * 1000
+
+
+def measure_command(client: Client, args: List[str], iterations: int) -> float:
+    with redirect_stdout(StringIO()):
+        client.execute(args)
+        start = perf_counter()
+        for _ in range(iterations):
+            client.execute(args)
+        elapsed = perf_counter() - start
+    return iterations / elapsed
+
+
+def measure_commands(path: str, iterations: int) -> Tuple[Dict[str, float], Dict[str, str]]:
+    settings = Settings()
+    timings = Timings()
+    adapter = PooledWebOSClientAdapter(settings, timings=timings)
+    client = create_client(settings, adapter, timings)
+    results = {}
+    errors = {}
+
+    try:
+        for group in client.command_group.subcommands:
+            if group.name not in GROUPS:
+                continue
+            for command in group.subcommands:
+                if command.name in SKIPPED_COMMANDS:
+                    continue
+                label = f'{group.name} {command.name}'
+                args = [group.name, command.name, *COMMAND_ARGS.get(command.name, []), '-n', TV_NAME, '-c', path]
+                try:
+                    results[f'commands_per_second[{label}]'] = measure_command(client, args, iterations)
+                except (Exception, SystemExit) as e:
+                    errors[label] = f'{type(e).__name__}: {e}'
+    finally:
+        adapter.close()
+    return results, errors
+
+
+def wait_for_input(tv: FakeTv, count: int, timeout: float = 30):
+    deadline = perf_counter() + timeout
+    while tv.input_messages < count:
+        if perf_counter() > deadline:
+            raise RuntimeError(f'The fake TV received {tv.input_messages} of {count} input messages.')
+        sleep(0.001)
+
+
+def measure_pointer(path: str, events: int, tv: FakeTv) -> Dict[str, float]:
+    from pywebostv.controls import InputControl
+
+    from lgtv_remote.stream import PointerStream
+
+    client = WebOSClientAdapter(Settings()).connect(path, TV_NAME)
+    control = InputControl(client)
+    control.connect_input()
+    try:
+        received = tv.input_messages
+        start = perf_counter()
+        for _ in range(events):
+            control.move(1, 1)
+        wait_for_input(tv, received + events)
+        direct = events / (perf_counter() - start)
+
+        pointer_stream = PointerStream(control)
+        pointer_stream.start()
+        received = tv.input_messages
+        start = perf_counter()
+        for _ in range(events):
+            pointer_stream.move(1, 1)
+        pointer_stream.stop()
+        wait_for_input(tv, received + pointer_stream.stats.sent)
+        streamed = events / (perf_counter() - start)
+    finally:
+        control.disconnect_input()
+        client.close()
+    return {
+        'pointer_direct_moves_per_second': direct,
+        'pointer_stream_events_per_second': streamed,
+        'pointer_stream_messages_sent': float(pointer_stream.stats.sent)
+    }
+
+
+def run(host: str, latency: float, iterations: int, cold_runs: int, pointer_events: int) -> Dict:
+    tv_thread = FakeTvThread(FakeTv(host, latency=latency))
+    tv_thread.start()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'lgtv.yaml')
+        with open(path, 'w') as file_object:
+            json.dump({
+                TV_NAME: {'host': host, 'client_key': DEFAULT_CLIENT_KEY},
+                MACROS_KEY: {TV_NAME: ['home', 'down', 'right', 'ok']}
+            }, file_object)
+        try:
+            results = {}
+            errors = {}
+            try:
+                results['cold_start_ms'] = measure_cold_start(path, cold_runs)
+            except RuntimeError as e:
+                errors['cold start'] = str(e)
+            results['register_ms'] = measure_register(path, iterations)
+            command_results, command_errors = measure_commands(path, iterations)
+            results.update(command_results)
+            errors.update(command_errors)
+            results.update(measure_pointer(path, pointer_events, tv_thread.tv))
+        finally:
+            tv_thread.stop()
+    return {
+        'time': time(),
+        'version': get_version(),
+        'python': sys.version.split()[0],
+        'latency_ms': latency * 1000,
+        'results': results,
+        'errors': errors
+    }
+
+
+def get_version() -> str:
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:
+        return 'unknown'
+    try:
+        return version('lgtv_remote')
+    except PackageNotFoundError:
+        return 'unknown'
+
+
+def load_previous(output: str) -> Optional[Dict]:
+    try:
+        with open(output, 'r') as file_object:
+            lines = [line for line in file_object if line.strip()]
+        return json.loads(lines[-1]) if lines else None
+    except (OSError, ValueError):
+        return None
+
+
+def format_report(record: Dict, previous: Optional[Dict]) -> str:
+    previous_results = previous['results'] if previous else {}
+    rows = [('BENCHMARK', 'VALUE', 'PREVIOUS', 'CHANGE')]
+    for name, value in record['results'].items():
+        before = previous_results.get(name)
+        change = f'{(value - before) / before * 100:+.1f}%' if before else ''
+        rows.append((name, f'{value:.2f}', '' if before is None else f'{before:.2f}', change))
+    widths = [max(len(row[index]) for row in rows) for index in range(4)]
+    lines = [
+        f'{row[0].ljust(widths[0])}  {row[1].rjust(widths[1])}  {row[2].rjust(widths[2])}  {row[3].rjust(widths[3])}'
+        for row in rows
+    ]
+    lines.extend(f'Error: {name}: {error}' for name, error in record['errors'].items())
+    return '\n'.join(lines)
+
+
+def main(args: Optional[List[str]] = None):
+    parser = ArgumentParser(
+        description='Benchmark lgtv-remote against a local fake webOS TV and store the results for comparison.',
+        prog='python -m lgtv_remote.benchmark'
+    )
+    parser.add_argument('--host', default='127.0.0.1', metavar='HOST',
+                        help='The loopback address on which to serve the fake TV. Port 3000 must be free.')
+    parser.add_argument('-l', '--latency-ms', default=0, type=float, metavar='LATENCY_MS',
+                        help='Artificial latency the fake TV adds to each response.')
+    parser.add_argument('-i', '--iterations', default=50, type=int, metavar='ITERATIONS')
+    parser.add_argument('-r', '--cold-runs', default=5, type=int, metavar='COLD_RUNS')
+    parser.add_argument('-p', '--pointer-events', default=2000, type=int, metavar='POINTER_EVENTS')
+    parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT, metavar='OUTPUT',
+                        help=f'A JSON lines file to which results are appended. Defaults to {DEFAULT_OUTPUT}.')
+    parser.add_argument('--no-store', action='store_true', dest='no_store',
+                        help='Compare with the last stored results without storing these.')
+    namespace = parser.parse_args(args)
+
+    previous = load_previous(namespace.output)
+    record = run(
+        namespace.host,
+        namespace.latency_ms / 1000,
+        namespace.iterations,
+        namespace.cold_runs,
+        namespace.pointer_events
+    )
+    print(format_report(record, previous))
+    if not namespace.no_store:
+        with open(namespace.output, 'a') as file_object:
+            file_object.write(json.dumps(record) + '\n')
+
+
+if __name__ == '__main__':
+    main()
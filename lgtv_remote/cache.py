@@ -0,0 +1,147 @@
+import json
+import os
+from hashlib import sha1
+from pathlib import Path
+from queue import Queue
+from time import time
+from typing import Callable, Dict, Optional, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pywebostv.connection import WebOSClient
+
+    from lgtv_remote.proxy import DaemonClient
+
+
+DEFAULT_CACHE_PATH = str(Path.home() / '.lgtv.responses')
+CACHE_TTLS = {
+    'ssap://audio/getVolume': 5,
+    'ssap://audio/getStatus': 5,
+    'ssap://audio/getSoundOutput': 30,
+    'ssap://com.webos.applicationManager/getForegroundAppInfo': 5,
+    'ssap://com.webos.service.tvpower/power/getPowerState': 5,
+    'ssap://com.webos.service.update/getCurrentSWInformation': 3600,
+    'ssap://system/getSystemInfo': 3600
+}
+INVALIDATE_ALL_URIS = ('ssap://system/turnOff',)
+
+
+def _digest(*values) -> str:
+    return sha1(json.dumps(values, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def _get_service(uri: str) -> str:
+    return uri.rpartition('/')[0]
+
+
+class ResponseCache:
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttls: Optional[Dict[str, float]] = None):
+        self.path = path
+        self.ttls = CACHE_TTLS if ttls is None else ttls
+
+    def get(self, tv: str, uri: str, payload: Optional[Dict]) -> Optional[Dict]:
+        try:
+            with open(self._get_entry_path(tv, uri, payload), 'r') as file_object:
+                entry = json.load(file_object)
+            if entry['expires'] < time():
+                return None
+            return entry['message']
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def set(self, tv: str, uri: str, payload: Optional[Dict], message: Dict):
+        ttl = self.ttls.get(uri)
+        if not ttl:
+            return
+        entry_path = self._get_entry_path(tv, uri, payload)
+        temporary_path = f'{entry_path}.{os.getpid()}'
+        try:
+            os.makedirs(os.path.dirname(entry_path), mode=0o700, exist_ok=True)
+            file_descriptor = os.open(temporary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(file_descriptor, 'w') as file_object:
+                json.dump({'expires': time() + ttl, 'message': message}, file_object)
+            os.replace(temporary_path, entry_path)
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def invalidate(self, tv: str, uri: str):
+        prefix = '' if uri in INVALIDATE_ALL_URIS else f'{_digest(_get_service(uri))}-'
+        try:
+            with os.scandir(self._get_tv_path(tv)) as entries:
+                for entry in entries:
+                    if entry.name.startswith(prefix):
+                        os.remove(entry.path)
+        except OSError:
+            pass
+
+    def _get_tv_path(self, tv: str) -> str:
+        return os.path.join(self.path, _digest(tv))
+
+    def _get_entry_path(self, tv: str, uri: str, payload: Optional[Dict]) -> str:
+        return os.path.join(self._get_tv_path(tv), f'{_digest(_get_service(uri))}-{_digest(uri, payload)}.json')
+
+
+class CachingClient:
+    def __init__(
+            self,
+            factory: Callable[[], Union['WebOSClient', 'DaemonClient']],
+            cache: ResponseCache,
+            tv: str,
+            read: bool = False,
+            release: Optional[Callable[[Union['WebOSClient', 'DaemonClient']], None]] = None
+    ):
+        self.cache = cache
+        self.tv = tv
+        self.read = read
+        self._factory = factory
+        self._release = release
+        self._client: Optional[Union['WebOSClient', 'DaemonClient']] = None
+
+    @property
+    def client(self) -> Union['WebOSClient', 'DaemonClient']:
+        if self._client is None:
+            self._client = self._factory()
+        return self._client
+
+    def release(self):
+        client = self._client
+        if client is not None and self._release is not None:
+            self._client = None
+            self._release(client)
+
+    def send_message(
+            self,
+            request_type: str,
+            uri: Optional[str],
+            payload: Optional[Dict],
+            unique_id: Optional[str] = None,
+            get_queue: bool = False,
+            callback: Optional[Callable[[Dict], None]] = None,
+            **kwargs
+    ) -> Optional[Queue]:
+        if request_type != 'request':
+            return self.client.send_message(request_type, uri, payload, unique_id, get_queue, callback, **kwargs)
+        cache = self.cache
+        tv = self.tv
+        cacheable = uri in cache.ttls
+        queue = Queue() if get_queue else None
+        deliver = queue.put if get_queue else callback
+
+        if cacheable and self.read:
+            message = cache.get(tv, uri, payload)
+            if message is not None:
+                deliver and deliver(message)
+                return queue
+
+        def on_message(message: Dict):
+            if message.get('type') != 'error' and (message.get('payload') or {}).get('returnValue') is not False:
+                if not cacheable:
+                    cache.invalidate(tv, uri)
+                elif self.read:
+                    cache.set(tv, uri, payload, message)
+            deliver and deliver(message)
+
+        self.client.send_message(request_type, uri, payload, unique_id, callback=on_message, **kwargs)
+        return queue
+
+    def __getattr__(self, name: str):
+        return getattr(self.client, name)
@@ -1,9 +1,13 @@
-from argparse import ArgumentParser, _SubParsersAction as SubParser
+import sys
+from argparse import ArgumentParser, Namespace, _SubParsersAction as SubParser
 from pathlib import Path
-from typing import Tuple, Dict, List
+from time import perf_counter
+from typing import Tuple, Dict, List, Optional
 
 from lgtv_remote.command import CommandGroupInterface, CommandInterface, CommandMetaInterface
 from lgtv_remote.exeception import ClientError
+from lgtv_remote.pipeline import Pipeline
+from lgtv_remote.timings import Timings
 
 
 class Client:
@@ -17,49 +21,173 @@ class Client:
                 'default': Path().home() / '.lgtv.yaml'
             }
         },
+        {
+            'args': ('--no-wait',),
+            'kwargs': {
+                'dest': 'no_wait',
+                'help': 'Send requests back to back without waiting for each response. Responses and errors are '
+                        'collected in the background and reported before exiting.',
+                'action': 'store_true'
+            }
+        },
+        {
+            'args': ('--cache',),
+            'kwargs': {
+                'dest': 'cache',
+                'help': 'Answer read-only queries, such as get-volume and info, from responses cached by recent '
+                        'lgtv-remote processes. Cached responses expire after a few seconds, or when a command '
+                        'changes the same setting.',
+                'action': 'store_true'
+            }
+        },
+        {
+            'args': ('--timings',),
+            'kwargs': {
+                'dest': 'timings',
+                'help': 'Print how long start-up, imports, argument parsing, loading settings, connecting, '
+                        'registering and requests took, per TV, to stderr before exiting. Start-up and the total are '
+                        'measured from when lgtv_remote is first imported, so they exclude the start-up of the '
+                        'Python interpreter itself.',
+                'action': 'store_true'
+            }
+        },
+        {
+            'args': ('--timings-format',),
+            'kwargs': {
+                'dest': 'timings_format',
+                'help': 'The format in which --timings prints. Pass "json" for machine readable output. Defaults to '
+                        'text.',
+                'metavar': 'FORMAT',
+                'choices': ('text', 'json'),
+                'default': 'text'
+            }
+        },
     )
 
-    def __init__(self, command_group: CommandGroupInterface):
+    def __init__(self, command_group: CommandGroupInterface, timings: Optional[Timings] = None):
         self.command_group = command_group
-        self.parser: ArgumentParser = ArgumentParser(
-            description=command_group.help,
-            prog=command_group.name
-        )
-        self.base_parser = ArgumentParser(add_help=False)
+        self._parsers: Dict[Optional[Tuple[str, ...]], ArgumentParser] = {}
+        self.pipeline = Pipeline()
+        self.timings = timings if timings is not None else Timings()
+        self._timings_format: Optional[str] = None
+
+    def run(self, args: List[str]):
+        timings = self.timings
 
-    def run(self, *args):
+        timings.add('startup', perf_counter() - timings.origin)
         try:
-            self._run(*args)
+            self._run(args)
         except (KeyboardInterrupt, ClientError) as e:
             if isinstance(e, ClientError):
                 print('Error: ', e)
             else:
                 print('Exiting...')
+        finally:
+            if self._timings_format is not None:
+                sys.stdout.flush()
+                print(timings.format(self._timings_format), file=sys.stderr)
 
-    def _run(self, *args):
-        self._set_global_options()
-        command_group = self.command_group
-        subparsers = self.parser.add_subparsers(
-            metavar=command_group.metavar,
-            help=command_group.help
-        )
-        self._set_commands(command_group.subcommands, subparsers, command_group.get_parents(self.base_parser))
-        namespace = self.parser.parse_args(*args)
+    def _run(self, args: List[str]):
+        pipeline = self.pipeline
+
+        for chained_args in self._split_chain(args):
+            self.execute(chained_args)
+        with self.timings.phase('wait'):
+            errors = pipeline.wait()
+        if errors:
+            raise ClientError(f'{len(errors)} requests failed:\n' + '\n'.join(errors))
+
+    def execute(self, args: List[str], defaults: Optional[Dict] = None):
+        with self.timings.phase('parse'):
+            parser = self._get_parser(args)
+            namespace = parser.parse_args(args)
+            defaults and self._inherit(namespace, defaults)
+        if getattr(namespace, 'timings', False):
+            self._timings_format = namespace.timings_format
         if hasattr(namespace, 'command'):
             command: CommandInterface = namespace.command
-            command.execute(namespace)
+            command.run(namespace)
         elif hasattr(namespace, 'group_help'):
             namespace.group_help()
         else:
-            self.parser.print_help()
+            parser.print_help()
+
+    def get_global_options(self, namespace: Namespace) -> Dict:
+        dests = [option['kwargs']['dest'] for option in self.options]
+        return {dest: getattr(namespace, dest) for dest in dests if hasattr(namespace, dest)}
+
+    def _inherit(self, namespace: Namespace, defaults: Dict):
+        base_parser = ArgumentParser(add_help=False)
+        self._set_global_options(base_parser)
+        for dest, value in defaults.items():
+            if hasattr(namespace, dest) and getattr(namespace, dest) == base_parser.get_default(dest):
+                setattr(namespace, dest, value)
+
+    def _split_chain(self, args: List[str]) -> List[List[str]]:
+        names = {command.name for command in self.command_group.subcommands}
+        chain = [[]]
+
+        for index, arg in enumerate(args):
+            if arg == '--' and index + 1 < len(args) and args[index + 1] in names:
+                chain.append([])
+            else:
+                chain[-1].append(arg)
+        return chain
+
+    def _get_parser(self, args: List[str]) -> ArgumentParser:
+        path = self._resolve_path(args)
+        parsers = self._parsers
+
+        if path not in parsers:
+            parsers[path] = self._create_parser(path)
+        return parsers[path]
+
+    def _resolve_path(self, args: List[str]) -> Optional[Tuple[str, ...]]:
+        command: CommandMetaInterface = self.command_group
+        path = []
+
+        for arg in args:
+            if not isinstance(command, CommandGroupInterface):
+                break
+            subcommands = {subcommand.name: subcommand for subcommand in command.subcommands}
+            if arg not in subcommands:
+                return None
+            command = subcommands[arg]
+            path.append(arg)
+        if not isinstance(command, CommandInterface):
+            return None
+        return tuple(path)
+
+    def _create_parser(self, path: Optional[Tuple[str, ...]]) -> ArgumentParser:
+        command_group = self.command_group
+        parser = ArgumentParser(
+            description=command_group.help,
+            prog=command_group.name,
+            epilog=f'Separate commands with "--" to run several in one invocation, sharing one connection per TV, '
+                   f'such as "{command_group.name} media mute -- system notify hello".'
+        )
+        base_parser = ArgumentParser(add_help=False)
+        self._set_global_options(base_parser)
+        parser.set_defaults(client=self)
+        subparsers = parser.add_subparsers(
+            metavar=command_group.metavar,
+            help=command_group.help
+        )
+        self._set_commands(command_group.subcommands, subparsers, command_group.get_parents(base_parser), base_parser,
+                           path)
+        return parser
 
     def _set_commands(
             self,
             commands: Tuple[CommandMetaInterface],
             subparsers: SubParser,
-            parents: List[ArgumentParser]
+            parents: List[ArgumentParser],
+            base_parser: ArgumentParser,
+            path: Optional[Tuple[str, ...]]
     ):
         for command in commands:
+            if path is not None and command.name != path[0]:
+                continue
             command_parser = subparsers.add_parser(
                 command.name,
                 help=command.help,
@@ -69,7 +197,7 @@ class Client:
                 self._set_command(command, command_parser)
             elif isinstance(command, CommandGroupInterface):
                 command_parser.set_defaults(group_help=command_parser.print_help)
-                self._set_command_group(command, command_parser)
+                self._set_command_group(command, command_parser, base_parser, path and path[1:])
 
     def _set_command(self, command: CommandInterface, command_parser: ArgumentParser):
         for option in command.options:
@@ -82,15 +210,17 @@ class Client:
     def _set_command_group(
             self,
             command_group: CommandGroupInterface,
-            command_parser: ArgumentParser
+            command_parser: ArgumentParser,
+            base_parser: ArgumentParser,
+            path: Optional[Tuple[str, ...]]
     ):
         subparsers = command_parser.add_subparsers(
             metavar=command_group.metavar,
             help=command_group.help
         )
-        self._set_commands(command_group.subcommands, subparsers, command_group.get_parents(self.base_parser))
+        self._set_commands(command_group.subcommands, subparsers, command_group.get_parents(base_parser), base_parser,
+                           path)
 
-    def _set_global_options(self):
+    def _set_global_options(self, base_parser: ArgumentParser):
         for option in self.options:
-            self.base_parser.add_argument(*option.get('args'), **option.get('kwargs'))
-
+            base_parser.add_argument(*option.get('args'), **option.get('kwargs'))
@@ -1,10 +1,55 @@
+import os
 from abc import ABC, abstractmethod
-from argparse import Namespace, ArgumentParser
-from typing import Optional, Dict, Tuple, List, Type
-
-from pywebostv.controls import WebOSControlBase
+from argparse import Namespace, ArgumentParser, ArgumentTypeError
+from functools import partial
+from importlib import import_module
+from threading import Lock
+from typing import Optional, Dict, Tuple, List, Type, Union, Callable, TYPE_CHECKING
 
 from lgtv_remote.adapter import WebOSClientAdapter
+from lgtv_remote.cache import CachingClient, ResponseCache
+from lgtv_remote.exeception import ClientError
+from lgtv_remote.pipeline import PipelinedControl
+
+if TYPE_CHECKING:
+    from pywebostv.connection import WebOSClient
+    from pywebostv.controls import WebOSControlBase
+
+    from lgtv_remote.aio import AsyncControl, AsyncWebOSClientAdapter
+    from lgtv_remote.proxy import DaemonClient
+
+
+OUTPUT_LOCK = Lock()
+
+
+def create_caching_client(
+        adapter: WebOSClientAdapter,
+        path: str,
+        friendly_name: str,
+        cached: bool = False,
+        factory: Optional[Callable[[], Union['WebOSClient', 'DaemonClient']]] = None
+) -> CachingClient:
+    return CachingClient(
+        factory or (lambda: adapter.create(path, friendly_name)),
+        ResponseCache(),
+        f'{os.path.abspath(path)}:{friendly_name}',
+        cached,
+        lambda created: adapter.release(path, friendly_name, created)
+    )
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        raise ArgumentTypeError(f'{value} is not a positive integer.')
+    return number
+
+
+def positive_float(value: str) -> float:
+    number = float(value)
+    if not number > 0:
+        raise ArgumentTypeError(f'{value} is not a positive number.')
+    return number
 
 
 class CommandMetaInterface(ABC):
@@ -34,6 +79,10 @@ class CommandInterface(CommandMetaInterface, ABC):
     def execute(self, namespace: Namespace):
         raise NotImplementedError
 
+    @abstractmethod
+    def run(self, namespace: Namespace):
+        raise NotImplementedError
+
 
 class CommandGroupInterface(CommandMetaInterface, ABC):
     @property
@@ -56,6 +105,9 @@ class CommandBase(CommandInterface, ABC):
     def defaults(self) -> Dict:
         return {}
 
+    def run(self, namespace: Namespace):
+        self.execute(namespace)
+
 
 class CommandGroupBase(CommandGroupInterface, ABC):
     def __init__(self, subcommands: Tuple[CommandMetaInterface, ...]):
@@ -84,9 +136,16 @@ class RootCommandGroup(CommandGroupBase):
 
 
 class ControlCommandBase(CommandBase, ABC):
-    def __init__(self, adapter: WebOSClientAdapter, control_type: Type[WebOSControlBase]):
+    def __init__(self, adapter: WebOSClientAdapter, control_type: Union[str, Type['WebOSControlBase']]):
         self.adapter = adapter
-        self.control_type = control_type
+        self._control_type = control_type
+
+    @property
+    def control_type(self) -> Type['WebOSControlBase']:
+        control_type = self._control_type
+        if isinstance(control_type, str):
+            return getattr(import_module('pywebostv.controls'), control_type)
+        return control_type
 
     @property
     def options(self) -> Tuple[Dict, ...]:
@@ -94,15 +153,132 @@ class ControlCommandBase(CommandBase, ABC):
             {
                 'args': ('-n', '--name'),
                 'kwargs': {
-                    'help': 'The name of an authenticated TV.',
+                    'help': 'The name of an authenticated TV, a group of TVs from your configuration file, or "all". '
+                            'Repeat this option or separate names with commas to control several TVs.',
                     'metavar': 'NAME',
-                    'dest': 'name'
+                    'dest': 'names',
+                    'action': 'append'
                 }
             },
+            {
+                'args': ('-w', '--workers'),
+                'kwargs': {
+                    'help': 'The maximum number of TVs controlled at the same time.',
+                    'metavar': 'WORKERS',
+                    'dest': 'workers',
+                    'type': int,
+                    'default': 8
+                }
+            }
         )
 
-    def create_control(self, path: str, friendly_name: str) -> WebOSControlBase:
+    def execute(self, namespace: Namespace):
+        name = namespace.name
+        path = namespace.config_path
+
+        label = name if getattr(namespace, 'fan_out', False) else None
+
+        control = self.create_control(path, name, namespace.cache)
+        with self.adapter.timings.phase('request', name):
+            if namespace.no_wait:
+                pipeline = namespace.client.pipeline
+                on_result = partial(self.handle, label=label)
+                self.send(PipelinedControl(control, pipeline, f'{name}: {self.name}', on_result), namespace)
+            else:
+                try:
+                    self.handle(self.send(control, namespace), label)
+                finally:
+                    control.client.release()
+
+    async def execute_async(self, namespace: Namespace, adapter: 'AsyncWebOSClientAdapter'):
+        name = namespace.name
+        path = namespace.config_path
+
+        label = name if getattr(namespace, 'fan_out', False) else None
+
+        control = await self.create_control_async(adapter, path, name)
+        self.handle(await self.send(control, namespace), label)
+
+    def send(self, control: Union['WebOSControlBase', 'AsyncControl'], namespace: Namespace):
+        raise NotImplementedError
+
+    def format(self, response) -> List[str]:
+        return []
+
+    def handle(self, response, label: Optional[str] = None):
+        lines = self.format(response)
+        if label is not None:
+            lines = [f'{label}: {line}' for line in lines]
+        with OUTPUT_LOCK:
+            for line in lines:
+                print(line)
+
+    def run(self, namespace: Namespace):
         adapter = self.adapter
+        path = namespace.config_path
+        workers = namespace.workers
+
+        names = adapter.resolve(path, namespace.names)
+        if len(names) == 1:
+            namespace.name = names[0]
+            self.execute(namespace)
+            return
+        from concurrent.futures import ThreadPoolExecutor, wait
+
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            futures = [
+                executor.submit(self.execute, Namespace(**{**vars(namespace), 'name': name, 'fan_out': True}))
+                for name in names
+            ]
+            wait(futures)
+        self._report(names, [future.exception() for future in futures])
+
+    async def run_async(self, namespace: Namespace, adapter: 'AsyncWebOSClientAdapter'):
+        import asyncio
+
+        path = namespace.config_path
+        semaphore = asyncio.Semaphore(max(namespace.workers, 1))
+
+        names = adapter.resolve(path, namespace.names)
+        if len(names) == 1:
+            namespace.name = names[0]
+            await self.execute_async(namespace, adapter)
+            return
+
+        async def execute(name: Optional[str]):
+            async with semaphore:
+                await self.execute_async(Namespace(**{**vars(namespace), 'name': name, 'fan_out': True}), adapter)
+
+        errors = await asyncio.gather(*(execute(name) for name in names), return_exceptions=True)
+        self._report(names, errors)
+
+    def create_control(self, path: str, friendly_name: str, cached: bool = False) -> 'WebOSControlBase':
+        with self.adapter.timings.phase('import'):
+            control_type = self.control_type
+
+        return control_type(create_caching_client(self.adapter, path, friendly_name, cached))
+
+    async def create_control_async(
+            self,
+            adapter: 'AsyncWebOSClientAdapter',
+            path: str,
+            friendly_name: str
+    ) -> 'AsyncControl':
+        from lgtv_remote.aio import AsyncControl
+
         control_type = self.control_type
 
-        return control_type(adapter.create(path, friendly_name))
+        return AsyncControl(await adapter.create(path, friendly_name), control_type)
+
+    @staticmethod
+    def _report(names: List[Optional[str]], errors: List[Optional[BaseException]]):
+        failures = 0
+        with OUTPUT_LOCK:
+            for name, error in zip(names, errors):
+                if error is None:
+                    print(f'{name}: OK')
+                else:
+                    failures += 1
+                    print(f'{name}: Error: {error}')
+        if failures:
+            raise ClientError(f'{failures} of {len(names)} TVs failed.')
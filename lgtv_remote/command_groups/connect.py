@@ -1,10 +1,15 @@
 import json
-from argparse import Namespace
-from typing import Tuple, Dict
+import sys
+from argparse import Namespace, FileType
+from queue import Empty
+from threading import Lock, Semaphore
+from time import monotonic
+from typing import Tuple, Dict, List, Union, Callable
 
 from lgtv_remote.action import JsonInputAction
-from lgtv_remote.command import CommandGroupBase, CommandBase
+from lgtv_remote.command import CommandGroupBase, CommandBase, create_caching_client
 from lgtv_remote.adapter import WebOSClientAdapter
+from lgtv_remote.exeception import ClientError
 
 
 class ConnectCommandGroup(CommandGroupBase):
@@ -39,8 +44,10 @@ class AuthenticateCommand(CommandBase):
             {
                 'args': ('ip_address',),
                 'kwargs': {
-                    'help': 'The IP address of the TV with which you are attempting to authenticate.',
-                    'metavar': 'IP_ADDRESS'
+                    'help': 'The IP address of the TV with which you are attempting to authenticate. Defaults to the '
+                            'only TV found by discovery.',
+                    'metavar': 'IP_ADDRESS',
+                    'nargs': '?'
                 }
             }
         )
@@ -51,6 +58,11 @@ class AuthenticateCommand(CommandBase):
         ip_address = namespace.ip_address
         path = namespace.config_path
 
+        if ip_address is None:
+            hosts = adapter.find()
+            if len(hosts) != 1:
+                raise ClientError(f'Found {len(hosts)} TVs. Please pass the IP address of the TV.')
+            ip_address, = hosts
         adapter.authenticate(name, ip_address, path)
 
     @property
@@ -68,12 +80,53 @@ class DiscoverCommand(CommandBase):
 
     @property
     def options(self) -> Tuple[Dict, ...]:
-        return tuple()
+        return (
+            {
+                'args': ('-t', '--timeout'),
+                'kwargs': {
+                    'help': 'Seconds to search for TVs. Defaults to 5.',
+                    'default': 5,
+                    'type': float,
+                    'metavar': 'TIMEOUT',
+                    'dest': 'timeout'
+                }
+            },
+            {
+                'args': ('-r', '--refresh'),
+                'kwargs': {
+                    'help': 'Search the network even when recently discovered TVs are cached.',
+                    'action': 'store_true',
+                    'dest': 'refresh'
+                }
+            },
+            {
+                'args': ('-p', '--probe'),
+                'kwargs': {
+                    'help': 'Fetch the model of every discovered TV, and the software version of authenticated TVs, '
+                            'and print them as a table.',
+                    'action': 'store_true',
+                    'dest': 'probe'
+                }
+            },
+        )
 
     def execute(self, namespace: Namespace):
         adapter = self.adapter
 
-        adapter.discover()
+        if namespace.probe:
+            rows = adapter.probe(namespace.config_path, namespace.timeout, namespace.refresh)
+            self._print_table(rows)
+        else:
+            adapter.discover(namespace.timeout, namespace.refresh)
+
+    @staticmethod
+    def _print_table(rows: List[Dict[str, str]]):
+        columns = (('host', 'HOST'), ('name', 'NAME'), ('friendly_name', 'FRIENDLY NAME'), ('model', 'MODEL'),
+                   ('software', 'SOFTWARE'))
+        widths = [max([len(title)] + [len(row[key]) for row in rows]) for key, title in columns]
+        print('  '.join(title.ljust(width) for (_, title), width in zip(columns, widths)).rstrip())
+        for row in rows:
+            print('  '.join(row[key].ljust(width) for (key, _), width in zip(columns, widths)).rstrip())
 
     @property
     def help(self) -> str:
@@ -100,18 +153,50 @@ class SendCommand(CommandBase):
                 'args': ('uri',),
                 'kwargs': {
                     'help': 'The URI of a command, such as "ssap://media.controls/play".',
-                    'metavar': 'URI'
+                    'metavar': 'URI',
+                    'nargs': '?'
                 }
             },
             {
                 'args': ('params',),
                 'kwargs': {
-                    'help': 'The URI of a command, such as "ssap://media.controls/play".',
+                    'help': 'The JSON payload of the command, such as \'{"volume": 10}\'.',
                     'metavar': 'params',
                     'default': None,
                     'action': JsonInputAction,
                     'nargs': '?'
                 }
+            },
+            {
+                'args': ('-f', '--file'),
+                'kwargs': {
+                    'help': 'A file with one JSON request per line, such as \'{"uri": "ssap://audio/getVolume", '
+                            '"payload": {}, "id": "volume"}\'. Use "-" to read requests from stdin. Responses are '
+                            'printed one per line as they arrive, tagged with the id or line number of their request.',
+                    'metavar': 'FILE',
+                    'type': FileType('r'),
+                    'dest': 'file'
+                }
+            },
+            {
+                'args': ('-w', '--window'),
+                'kwargs': {
+                    'help': 'The maximum number of requests from --file waiting for a response at the same time.',
+                    'metavar': 'WINDOW',
+                    'type': int,
+                    'default': 16,
+                    'dest': 'window'
+                }
+            },
+            {
+                'args': ('-t', '--timeout'),
+                'kwargs': {
+                    'help': 'Seconds to wait for a response. Defaults to 60.',
+                    'metavar': 'TIMEOUT',
+                    'type': float,
+                    'default': 60,
+                    'dest': 'timeout'
+                }
             }
         )
 
@@ -123,19 +208,71 @@ class SendCommand(CommandBase):
         name = namespace.name
         path = namespace.config_path
         uri = namespace.uri
+        params = namespace.params
 
-        client = adapter.create(path, name)
-        queue = client.send_message('request', uri, {}, get_queue=True)
-        response = queue.get(timeout=60, block=True)
+        if namespace.file is not None:
+            self.send_bulk(namespace)
+            return
+        if uri is None:
+            raise ClientError('Please pass the URI of a command or a file of requests.')
+        client = create_caching_client(adapter, path, name, namespace.cache)
+        try:
+            queue = client.send_message('request', uri, params if params is not None else {}, get_queue=True)
+            response = queue.get(timeout=namespace.timeout, block=True)
+        except Empty:
+            raise ClientError(f'Timed out waiting for a response to {uri}.') from None
+        finally:
+            client.release()
         if response:
             try:
                 print(json.dumps(response))
             except ValueError:
                 print(response)
 
+    def send_bulk(self, namespace: Namespace):
+        adapter = self.adapter
+        name = namespace.name
+        path = namespace.config_path
+        window = max(namespace.window, 1)
+        timeout = namespace.timeout
+        semaphore = Semaphore(window)
+        lock = Lock()
+
+        def create_callback(tag: Union[str, int], uri: str) -> Callable[[Dict], None]:
+            def callback(response: Dict):
+                with lock:
+                    sys.stdout.write(json.dumps({'request': tag, 'uri': uri, 'response': response}) + '\n')
+                    sys.stdout.flush()
+                semaphore.release()
+
+            return callback
+
+        client = create_caching_client(adapter, path, name, namespace.cache, lambda: adapter.connect(path, name))
+        try:
+            with namespace.file as file_object:
+                for line_number, line in enumerate(file_object, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        request = json.loads(line)
+                        uri = request['uri']
+                        payload = request.get('payload') or {}
+                    except (ValueError, KeyError, TypeError, AttributeError):
+                        raise ClientError(f'Line {line_number}: Invalid request.') from None
+                    if not semaphore.acquire(timeout=timeout):
+                        raise ClientError('Timed out waiting for a response from TV.')
+                    callback = create_callback(request.get('id', line_number), uri)
+                    client.send_message('request', uri, payload, callback=callback)
+            deadline = monotonic() + timeout
+            for _ in range(window):
+                if not semaphore.acquire(timeout=max(deadline - monotonic(), 0)):
+                    raise ClientError('Timed out waiting for a response from TV.')
+        finally:
+            client.release()
+
     @property
     def help(self) -> str:
-        return 'Send a command'
+        return 'Send a command, or a stream of commands from a file, to your TV.'
 
     @property
     def name(self) -> str:
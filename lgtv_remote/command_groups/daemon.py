@@ -0,0 +1,42 @@
+from argparse import Namespace
+from typing import Tuple, Dict
+
+from lgtv_remote.command import CommandBase
+from lgtv_remote.daemon import Daemon, DEFAULT_SOCKET_PATH, SOCKET_ENVIRONMENT_VARIABLE
+from lgtv_remote.adapter import PooledWebOSClientAdapter
+
+
+class DaemonCommand(CommandBase):
+    def __init__(self, adapter: PooledWebOSClientAdapter):
+        self.adapter = adapter
+
+    @property
+    def options(self) -> Tuple[Dict, ...]:
+        return (
+            {
+                'args': ('-s', '--socket-path'),
+                'kwargs': {
+                    'help': f'The path of the Unix socket on which to listen. By default this will be '
+                            f'{DEFAULT_SOCKET_PATH}. Other commands only use the daemon when it listens on their '
+                            f'default socket, so to use another path set the {SOCKET_ENVIRONMENT_VARIABLE} environment '
+                            f'variable for both the daemon and the commands instead.',
+                    'metavar': 'SOCKET_PATH',
+                    'dest': 'socket_path',
+                    'default': DEFAULT_SOCKET_PATH
+                }
+            },
+        )
+
+    def execute(self, namespace: Namespace):
+        adapter = self.adapter
+        socket_path = namespace.socket_path
+
+        Daemon(adapter).serve(socket_path)
+
+    @property
+    def help(self) -> str:
+        return 'Run in the background, keeping TV sessions authenticated so other commands respond faster.'
+
+    @property
+    def name(self) -> str:
+        return 'daemon'
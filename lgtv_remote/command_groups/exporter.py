@@ -0,0 +1,91 @@
+from argparse import Namespace
+from typing import Tuple, Dict
+
+from lgtv_remote.command import CommandBase
+from lgtv_remote.exeception import ClientError
+from lgtv_remote.settings import SettingsInterface
+
+
+class ExporterCommand(CommandBase):
+    def __init__(self, settings: SettingsInterface):
+        self.settings = settings
+
+    @property
+    def options(self) -> Tuple[Dict, ...]:
+        return (
+            {
+                'args': ('-n', '--name'),
+                'kwargs': {
+                    'help': 'The name of an authenticated TV or a group of TVs from your configuration file. Repeat '
+                            'this option or separate names with commas to export several TVs. By default all TVs are '
+                            'exported.',
+                    'metavar': 'NAME',
+                    'dest': 'names',
+                    'action': 'append'
+                }
+            },
+            {
+                'args': ('-a', '--address'),
+                'kwargs': {
+                    'help': 'The address on which to serve metrics. Defaults to 127.0.0.1.',
+                    'metavar': 'ADDRESS',
+                    'dest': 'address',
+                    'default': '127.0.0.1'
+                }
+            },
+            {
+                'args': ('-p', '--port'),
+                'kwargs': {
+                    'help': 'The port on which to serve metrics. Defaults to 9823.',
+                    'metavar': 'PORT',
+                    'dest': 'port',
+                    'type': int,
+                    'default': 9823
+                }
+            },
+            {
+                'args': ('-i', '--interval'),
+                'kwargs': {
+                    'help': 'Seconds between polls of each TV. Defaults to 15.',
+                    'metavar': 'INTERVAL',
+                    'dest': 'interval',
+                    'type': float,
+                    'default': 15
+                }
+            },
+            {
+                'args': ('-t', '--timeout'),
+                'kwargs': {
+                    'help': 'Seconds to wait for a TV to connect or respond. Defaults to 5.',
+                    'metavar': 'TIMEOUT',
+                    'dest': 'timeout',
+                    'type': float,
+                    'default': 5
+                }
+            }
+        )
+
+    def execute(self, namespace: Namespace):
+        import asyncio
+
+        from lgtv_remote.aio import AsyncWebOSClientAdapter
+        from lgtv_remote.exporter import Exporter
+
+        settings = self.settings
+        path = namespace.config_path
+
+        settings.load(path)
+        names = settings.resolve(namespace.names or ['all'])
+        if not names:
+            raise ClientError('No authenticated TVs to export.')
+        exporter = Exporter(AsyncWebOSClientAdapter(settings), path, names, namespace.interval, namespace.timeout)
+        print(f'Serving metrics for {len(names)} TVs on http://{namespace.address}:{namespace.port}/metrics')
+        asyncio.run(exporter.serve(namespace.address, namespace.port))
+
+    @property
+    def help(self) -> str:
+        return 'Poll your TVs and serve their state as Prometheus metrics.'
+
+    @property
+    def name(self) -> str:
+        return 'exporter'
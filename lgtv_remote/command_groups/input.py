@@ -1,15 +1,18 @@
+import sys
 from argparse import Namespace
-from typing import Type, Tuple, Optional
+from abc import ABC
+from typing import Tuple, Dict, Iterable, List, Optional, Type, Union, TYPE_CHECKING
 
-from pywebostv.controls import WebOSControlBase
-try:
-    from pynput.mouse import Controller
-except KeyboardInterrupt:
-    print('Exiting...')
-
-from lgtv_remote.agent import MouseAgent, BlockingWindow, KeyboardAgent
-from lgtv_remote.command import CommandGroupBase, ControlCommandBase, CommandMetaInterface
+from lgtv_remote.command import CommandGroupBase, ControlCommandBase, CommandMetaInterface, positive_float, \
+    positive_int
 from lgtv_remote.adapter import WebOSClientAdapter
+from lgtv_remote.exeception import ClientError
+from lgtv_remote.macro import MacroStep, compile_macro, parse_duration, play, play_async
+
+if TYPE_CHECKING:
+    from pywebostv.controls import WebOSControlBase
+
+    from lgtv_remote.aio import AsyncWebOSClientAdapter
 
 
 class InputCommandGroup(CommandGroupBase):
@@ -17,7 +20,7 @@ class InputCommandGroup(CommandGroupBase):
             self,
             subcommands: Tuple[CommandMetaInterface, ...],
             adapter: WebOSClientAdapter,
-            control_type: Type[WebOSControlBase]
+            control_type: Union[str, Type['WebOSControlBase']]
     ):
         super().__init__(subcommands)
         self.adapter = adapter
@@ -75,20 +78,98 @@ class InputCommandGroup(CommandGroupBase):
         )
 
 
-class PressButtonCommand(ControlCommandBase):
-    def __init__(self, button: str, adapter: WebOSClientAdapter, control_type: Type[WebOSControlBase]):
-        self.button = button
-        super().__init__(adapter, control_type)
+class InputSequenceCommandBase(ControlCommandBase, ABC):
+    @property
+    def interval_help(self) -> str:
+        return 'The time to wait between button presses, such as 40ms. By default presses are sent without waiting.'
+
+    @property
+    def interval_option(self) -> Dict:
+        return {
+            'args': ('-i', '--interval'),
+            'kwargs': {
+                'help': self.interval_help,
+                'metavar': 'INTERVAL',
+                'dest': 'interval',
+                'type': parse_duration,
+                'default': 0
+            }
+        }
+
+    def run(self, namespace: Namespace):
+        with self.adapter.timings.phase('compile'):
+            namespace.steps = self.compile(namespace, self.adapter)
+        super().run(namespace)
+
+    async def run_async(self, namespace: Namespace, adapter: 'AsyncWebOSClientAdapter'):
+        namespace.steps = self.compile(namespace, adapter)
+        await super().run_async(namespace, adapter)
+
+    def compile(
+            self,
+            namespace: Namespace,
+            adapter: Union[WebOSClientAdapter, 'AsyncWebOSClientAdapter']
+    ) -> List[MacroStep]:
+        raise NotImplementedError
 
     def execute(self, namespace: Namespace):
-        button = self.button
         name = namespace.name
         path = namespace.config_path
+        steps = namespace.steps
 
         control = self.create_control(path, name)
-        control.connect_input()
-        getattr(control, button)(block=True)
-        control.disconnect_input()
+        with self.adapter.timings.phase('request', name):
+            try:
+                control.connect_input()
+                try:
+                    play(steps, control.mouse_ws.send)
+                finally:
+                    control.disconnect_input()
+            finally:
+                control.client.release()
+
+    async def execute_async(self, namespace: Namespace, adapter: 'AsyncWebOSClientAdapter'):
+        name = namespace.name
+        path = namespace.config_path
+        steps = namespace.steps
+
+        control = await self.create_control_async(adapter, path, name)
+        await control.connect_input()
+        try:
+            await play_async(steps, control.send_input)
+        finally:
+            await control.disconnect_input()
+
+
+class PressButtonCommand(InputSequenceCommandBase):
+    def __init__(self, button: str, adapter: WebOSClientAdapter, control_type: Union[str, Type['WebOSControlBase']]):
+        self.button = button
+        super().__init__(adapter, control_type)
+
+    @property
+    def options(self) -> Tuple[Dict, ...]:
+        return super().options + (
+            {
+                'args': ('-r', '--repeat'),
+                'kwargs': {
+                    'help': 'How many times to press the button over one input connection. By default this will be 1.',
+                    'metavar': 'REPEAT',
+                    'dest': 'repeat',
+                    'type': positive_int,
+                    'default': 1
+                }
+            },
+            self.interval_option
+        )
+
+    def compile(
+            self,
+            namespace: Namespace,
+            adapter: Union[WebOSClientAdapter, 'AsyncWebOSClientAdapter']
+    ) -> List[MacroStep]:
+        button = self.button
+
+        return compile_macro(button, [button] * namespace.repeat, namespace.interval)
 
     @property
     def help(self) -> str:
@@ -132,14 +213,42 @@ class PressButtonCommand(ControlCommandBase):
 
 
 class CaptureMouseCommand(ControlCommandBase):
+    @property
+    def options(self) -> Tuple[Dict, ...]:
+        return super().options + (
+            {
+                'args': ('-r', '--rate'),
+                'kwargs': {
+                    'help': 'How many times per second mouse movement is sent to your TV. By default this will be 60.',
+                    'metavar': 'RATE',
+                    'dest': 'rate',
+                    'type': positive_float,
+                    'default': 60
+                }
+            },
+        )
+
     def execute(self, namespace: Namespace):
         name = namespace.name
         path = namespace.config_path
+        rate = namespace.rate
+
+        from pynput.mouse import Controller
+        from lgtv_remote.agent import MouseAgent, BlockingWindow
 
         control = self.create_control(path, name)
-        control.connect_input()
-        MouseAgent(control, BlockingWindow(Controller())).listen()
-        control.disconnect_input()
+        try:
+            control.connect_input()
+            agent = MouseAgent(control, BlockingWindow(Controller()), rate)
+            agent.listen()
+            control.disconnect_input()
+        finally:
+            control.client.release()
+        stats = agent.stats
+        print(f'Sent {stats.sent} of {stats.received} mouse events ({stats.merged} merged, {stats.dropped} dropped).')
+
+    async def execute_async(self, namespace: Namespace, adapter: 'AsyncWebOSClientAdapter'):
+        raise ClientError(f'{self.name} is interactive and cannot run asynchronously.')
 
     @property
     def help(self) -> str:
@@ -155,10 +264,22 @@ class CaptureKeyboardCommand(ControlCommandBase):
         name = namespace.name
         path = namespace.config_path
 
+        from pynput.mouse import Controller
+        from lgtv_remote.agent import KeyboardAgent, BlockingWindow
+
         control = self.create_control(path, name)
-        control.connect_input()
-        KeyboardAgent(control, BlockingWindow(Controller())).listen()
-        control.disconnect_input()
+        try:
+            control.connect_input()
+            agent = KeyboardAgent(control, BlockingWindow(Controller()))
+            agent.listen()
+            control.disconnect_input()
+        finally:
+            control.client.release()
+        stats = agent.stats
+        print(f'Sent {stats.sent} text requests for {stats.received} key presses ({stats.dropped} dropped).')
+
+    async def execute_async(self, namespace: Namespace, adapter: 'AsyncWebOSClientAdapter'):
+        raise ClientError(f'{self.name} is interactive and cannot run asynchronously.')
 
     @property
     def help(self) -> str:
@@ -167,3 +288,151 @@ class CaptureKeyboardCommand(ControlCommandBase):
     @property
     def name(self) -> str:
         return 'capture-keyboard'
+
+
+class TypeCommand(ControlCommandBase):
+    @property
+    def options(self) -> Tuple[Dict, ...]:
+        return super().options + (
+            {
+                'args': ('text',),
+                'kwargs': {
+                    'help': 'The text to type into the focused text field on your TV. Text is read from stdin when '
+                            'omitted, and each line break presses enter.',
+                    'metavar': 'TEXT',
+                    'nargs': '?',
+                    'default': None
+                }
+            },
+            {
+                'args': ('-s', '--chunk-size'),
+                'kwargs': {
+                    'help': 'The maximum number of characters sent in one request. By default this will be 64.',
+                    'metavar': 'CHUNK_SIZE',
+                    'dest': 'chunk_size',
+                    'type': positive_int,
+                    'default': 64
+                }
+            }
+        )
+
+    def execute(self, namespace: Namespace):
+        name = namespace.name
+        path = namespace.config_path
+        chunk_size = namespace.chunk_size
+
+        from lgtv_remote.stream import TextStream
+
+        control = self.create_control(path, name)
+        text_stream = TextStream(control, chunk_size=chunk_size)
+        text_stream.start()
+        try:
+            for line in self._read_lines(namespace):
+                text = line.rstrip('\n')
+                text and text_stream.type(text)
+                line.endswith('\n') and text_stream.enter()
+        finally:
+            text_stream.stop()
+            control.client.release()
+        stats = text_stream.stats
+        if stats.dropped:
+            raise ClientError(f'{stats.dropped} of {stats.sent + stats.dropped} text requests failed.')
+
+    async def execute_async(self, namespace: Namespace, adapter: 'AsyncWebOSClientAdapter'):
+        name = namespace.name
+        path = namespace.config_path
+        chunk_size = namespace.chunk_size
+
+        control = await self.create_control_async(adapter, path, name)
+        for line in self._read_lines(namespace):
+            text = line.rstrip('\n')
+            for start in range(0, len(text), chunk_size):
+                await control.type(text[start:start + chunk_size])
+            line.endswith('\n') and await control.enter()
+
+    @staticmethod
+    def _read_lines(namespace: Namespace) -> Iterable[str]:
+        text = namespace.text
+        if text is None:
+            return sys.stdin
+        return text.splitlines(keepends=True)
+
+    @property
+    def help(self) -> str:
+        return 'Type text into the focused text field on your TV.'
+
+    @property
+    def name(self) -> str:
+        return 'type'
+
+
+class MacroCommand(InputSequenceCommandBase):
+    @property
+    def options(self) -> Tuple[Dict, ...]:
+        return super().options + (
+            {
+                'args': ('macro',),
+                'kwargs': {
+                    'help': 'The name of a macro under "macros" in your configuration file, such as "settings: [home, '
+                            'down, down, right, ok]". A step may also be a mapping such as "{button: ok, delay: '
+                            '500ms}" to wait before pressing the button. Delays need a unit, ms or s.',
+                    'metavar': 'MACRO'
+                }
+            },
+            self.interval_option
+        )
+
+    @property
+    def interval_help(self) -> str:
+        return (
+            'The time to wait between steps without their own delay, such as 100ms. By default steps are sent without '
+            'waiting.'
+        )
+
+    def compile(
+            self,
+            namespace: Namespace,
+            adapter: Union[WebOSClientAdapter, 'AsyncWebOSClientAdapter']
+    ) -> List[MacroStep]:
+        macro = namespace.macro
+
+        return compile_macro(macro, adapter.get_macro(namespace.config_path, macro), namespace.interval)
+
+    @property
+    def help(self) -> str:
+        return 'Press a named sequence of buttons from your configuration file over one input connection.'
+
+    @property
+    def name(self) -> str:
+        return 'macro'
+
+
+class KeysCommand(InputSequenceCommandBase):
+    @property
+    def options(self) -> Tuple[Dict, ...]:
+        return super().options + (
+            {
+                'args': ('buttons',),
+                'kwargs': {
+                    'help': 'The buttons to press in order, such as "up up right ok".',
+                    'metavar': 'BUTTON',
+                    'nargs': '+'
+                }
+            },
+            self.interval_option
+        )
+
+    def compile(
+            self,
+            namespace: Namespace,
+            adapter: Union[WebOSClientAdapter, 'AsyncWebOSClientAdapter']
+    ) -> List[MacroStep]:
+        return compile_macro(self.name, namespace.buttons, namespace.interval)
+
+    @property
+    def help(self) -> str:
+        return 'Press a sequence of buttons over one input connection.'
+
+    @property
+    def name(self) -> str:
+        return 'keys'
@@ -1,5 +1,5 @@
 from argparse import Namespace
-from typing import Tuple, Dict, Optional
+from typing import Tuple, Dict, List, Optional
 
 from lgtv_remote.command import CommandGroupBase, ControlCommandBase
 
@@ -19,12 +19,8 @@ class MediaCommandGroup(CommandGroupBase):
 
 
 class VolumeUpCommand(ControlCommandBase):
-    def execute(self, namespace: Namespace):
-        name = namespace.name
-        path = namespace.config_path
-
-        control = self.create_control(path, name)
-        control.volume_up(block=True)
+    def send(self, control, namespace: Namespace):
+        return control.volume_up(block=True)
 
     @property
     def help(self) -> str:
@@ -36,12 +32,8 @@ class VolumeUpCommand(ControlCommandBase):
 
 
 class VolumeDownCommand(ControlCommandBase):
-    def execute(self, namespace: Namespace):
-        name = namespace.name
-        path = namespace.config_path
-
-        control = self.create_control(path, name)
-        control.volume_down(block=True)
+    def send(self, control, namespace: Namespace):
+        return control.volume_down(block=True)
 
     @property
     def help(self) -> str:
@@ -53,14 +45,11 @@ class VolumeDownCommand(ControlCommandBase):
 
 
 class GetVolumeCommand(ControlCommandBase):
-    def execute(self, namespace: Namespace):
-        name = namespace.name
-        path = namespace.config_path
+    def send(self, control, namespace: Namespace):
+        return control.get_volume(block=True)
 
-        control = self.create_control(path, name)
-        response = control.get_volume(block=True)
-        for key, value in response.items():
-            print(key, ': ', value)
+    def format(self, response) -> List[str]:
+        return [f'{key} :  {value}' for key, value in response.items()]
 
     @property
     def help(self) -> str:
@@ -84,13 +73,10 @@ class SetVolumeCommand(ControlCommandBase):
             },
         )
 
-    def execute(self, namespace: Namespace):
-        name = namespace.name
-        path = namespace.config_path
+    def send(self, control, namespace: Namespace):
         level = namespace.level
 
-        control = self.create_control(path, name)
-        control.set_volume(level, block=True)
+        return control.set_volume(level, block=True)
 
     @property
     def help(self) -> str:
@@ -102,12 +88,8 @@ class SetVolumeCommand(ControlCommandBase):
 
 
 class MuteCommand(ControlCommandBase):
-    def execute(self, namespace: Namespace):
-        name = namespace.name
-        path = namespace.config_path
-
-        control = self.create_control(path, name)
-        control.mute(True, block=True)
+    def send(self, control, namespace: Namespace):
+        return control.mute(True, block=True)
 
     @property
     def help(self) -> str:
@@ -119,12 +101,8 @@ class MuteCommand(ControlCommandBase):
 
 
 class UnmuteCommand(ControlCommandBase):
-    def execute(self, namespace: Namespace):
-        name = namespace.name
-        path = namespace.config_path
-
-        control = self.create_control(path, name)
-        control.mute(False, block=True)
+    def send(self, control, namespace: Namespace):
+        return control.mute(False, block=True)
 
     @property
     def help(self) -> str:
@@ -136,12 +114,8 @@ class UnmuteCommand(ControlCommandBase):
 
 
 class PlayCommand(ControlCommandBase):
-    def execute(self, namespace: Namespace):
-        name = namespace.name
-        path = namespace.config_path
-
-        control = self.create_control(path, name)
-        control.play(block=True)
+    def send(self, control, namespace: Namespace):
+        return control.play(block=True)
 
     @property
     def help(self) -> str:
@@ -153,12 +127,8 @@ class PlayCommand(ControlCommandBase):
 
 
 class PauseCommand(ControlCommandBase):
-    def execute(self, namespace: Namespace):
-        name = namespace.name
-        path = namespace.config_path
-
-        control = self.create_control(path, name)
-        control.pause(block=True)
+    def send(self, control, namespace: Namespace):
+        return control.pause(block=True)
 
     @property
     def help(self) -> str:
@@ -170,12 +140,8 @@ class PauseCommand(ControlCommandBase):
 
 
 class StopCommand(ControlCommandBase):
-    def execute(self, namespace: Namespace):
-        name = namespace.name
-        path = namespace.config_path
-
-        control = self.create_control(path, name)
-        control.stop(block=True)
+    def send(self, control, namespace: Namespace):
+        return control.stop(block=True)
 
     @property
     def help(self) -> str:
@@ -187,12 +153,8 @@ class StopCommand(ControlCommandBase):
 
 
 class RewindCommand(ControlCommandBase):
-    def execute(self, namespace: Namespace):
-        name = namespace.name
-        path = namespace.config_path
-
-        control = self.create_control(path, name)
-        control.rewind(block=True)
+    def send(self, control, namespace: Namespace):
+        return control.rewind(block=True)
 
     @property
     def help(self) -> str:
@@ -204,12 +166,8 @@ class RewindCommand(ControlCommandBase):
 
 
 class FastForwardCommand(ControlCommandBase):
-    def execute(self, namespace: Namespace):
-        name = namespace.name
-        path = namespace.config_path
-
-        control = self.create_control(path, name)
-        control.fast_forward(block=True)
+    def send(self, control, namespace: Namespace):
+        return control.fast_forward(block=True)
 
     @property
     def help(self) -> str:
@@ -0,0 +1,61 @@
+import shlex
+import sys
+from argparse import Namespace, FileType
+from typing import Tuple, Dict
+
+from lgtv_remote.command import CommandBase
+from lgtv_remote.exeception import ClientError
+
+
+class RunCommand(CommandBase):
+    @property
+    def options(self) -> Tuple[Dict, ...]:
+        return (
+            {
+                'args': ('file',),
+                'kwargs': {
+                    'help': 'A file with one lgtv-remote command per line, such as "media volume-up -n bedroom". Use '
+                            '"-" to read commands from stdin.',
+                    'metavar': 'FILE',
+                    'type': FileType('r')
+                }
+            },
+            {
+                'args': ('-k', '--keep-going'),
+                'kwargs': {
+                    'help': 'Continue with the next command when a command fails.',
+                    'action': 'store_true',
+                    'dest': 'keep_going'
+                }
+            }
+        )
+
+    def execute(self, namespace: Namespace):
+        client = namespace.client
+        keep_going = namespace.keep_going
+        defaults = client.get_global_options(namespace)
+
+        with namespace.file as file_object:
+            for line_number, line in enumerate(file_object, 1):
+                args = shlex.split(line, comments=True)
+                if not args:
+                    continue
+                try:
+                    try:
+                        client.execute(args, defaults)
+                    except SystemExit as e:
+                        if e.code:
+                            raise ClientError(f'Invalid command "{line.strip()}".') from None
+                except ClientError as e:
+                    if not keep_going:
+                        raise ClientError(f'Line {line_number}: {e}') from None
+                    print('Error: ', f'Line {line_number}: {e}')
+                sys.stdout.flush()
+
+    @property
+    def help(self) -> str:
+        return 'Run commands read from a file or stdin, one per line, reusing one connection per TV.'
+
+    @property
+    def name(self) -> str:
+        return 'run'
@@ -0,0 +1,149 @@
+from argparse import Namespace
+from pathlib import Path
+from typing import Tuple, Dict, TYPE_CHECKING
+
+from lgtv_remote.command import CommandBase
+from lgtv_remote.exeception import ClientError
+from lgtv_remote.settings import SettingsInterface
+
+if TYPE_CHECKING:
+    from lgtv_remote.simulator import Simulator
+
+
+class SimulateCommand(CommandBase):
+    def __init__(self, settings: SettingsInterface):
+        self.settings = settings
+
+    @property
+    def options(self) -> Tuple[Dict, ...]:
+        return (
+            {
+                'args': ('--count',),
+                'kwargs': {
+                    'help': 'The number of TVs to simulate. Defaults to 1.',
+                    'metavar': 'COUNT',
+                    'dest': 'count',
+                    'type': int,
+                    'default': 1
+                }
+            },
+            {
+                'args': ('-a', '--base-address'),
+                'kwargs': {
+                    'help': 'The loopback address of the first TV. Each following TV takes the next address. Defaults '
+                            'to 127.0.1.1.',
+                    'metavar': 'BASE_ADDRESS',
+                    'dest': 'base_address',
+                    'default': '127.0.1.1'
+                }
+            },
+            {
+                'args': ('-l', '--latency-ms'),
+                'kwargs': {
+                    'help': 'Milliseconds each TV waits before answering a request.',
+                    'metavar': 'LATENCY_MS',
+                    'dest': 'latency_ms',
+                    'type': float,
+                    'default': 0
+                }
+            },
+            {
+                'args': ('-j', '--jitter-ms'),
+                'kwargs': {
+                    'help': 'Up to this many random milliseconds are added to the latency of each request.',
+                    'metavar': 'JITTER_MS',
+                    'dest': 'jitter_ms',
+                    'type': float,
+                    'default': 0
+                }
+            },
+            {
+                'args': ('-f', '--failure-rate'),
+                'kwargs': {
+                    'help': 'The fraction of requests answered with an error, such as 0.05.',
+                    'metavar': 'FAILURE_RATE',
+                    'dest': 'failure_rate',
+                    'type': float,
+                    'default': 0
+                }
+            },
+            {
+                'args': ('-d', '--drop-rate'),
+                'kwargs': {
+                    'help': 'The fraction of requests for which the TV drops the connection instead of answering.',
+                    'metavar': 'DROP_RATE',
+                    'dest': 'drop_rate',
+                    'type': float,
+                    'default': 0
+                }
+            },
+            {
+                'args': ('-p', '--pairing-delay'),
+                'kwargs': {
+                    'help': 'Seconds a TV waits after prompting before accepting an unknown client. Defaults to 1.',
+                    'metavar': 'PAIRING_DELAY',
+                    'dest': 'pairing_delay',
+                    'type': float,
+                    'default': 1
+                }
+            },
+            {
+                'args': ('--no-ssdp',),
+                'kwargs': {
+                    'help': 'Do not answer SSDP searches from "connect discover".',
+                    'dest': 'no_ssdp',
+                    'action': 'store_true'
+                }
+            },
+            {
+                'args': ('-o', '--output-config'),
+                'kwargs': {
+                    'help': 'Add the simulated TVs, already authenticated, to this configuration file, along with a '
+                            'group named "simulated".',
+                    'metavar': 'OUTPUT_CONFIG',
+                    'dest': 'output_config'
+                }
+            }
+        )
+
+    def execute(self, namespace: Namespace):
+        import asyncio
+
+        from lgtv_remote.simulator import Simulator
+
+        if namespace.count < 1:
+            raise ClientError('Please simulate at least one TV.')
+        simulator = Simulator(
+            namespace.count,
+            namespace.base_address,
+            not namespace.no_ssdp,
+            latency=namespace.latency_ms / 1000,
+            jitter=namespace.jitter_ms / 1000,
+            failure_rate=namespace.failure_rate,
+            drop_rate=namespace.drop_rate,
+            pairing_delay=namespace.pairing_delay
+        )
+        namespace.output_config and self._write_config(namespace.output_config, simulator)
+        tvs = simulator.tvs
+        print(f'Simulating {len(tvs)} TVs from {tvs[0].host} to {tvs[-1].host}. Press Ctrl+C to stop.', flush=True)
+        asyncio.run(simulator.serve())
+
+    def _write_config(self, path: str, simulator: 'Simulator'):
+        settings = self.settings
+        names = []
+
+        Path(path).exists() and settings.load(path)
+        for index, tv in enumerate(simulator.tvs, 1):
+            name = f'simulated_{index}'
+            settings.set(name, tv.host, tv.client_key)
+            names.append(name)
+        settings.set_group('simulated', names)
+        settings.serialize(path)
+
+    @property
+    def help(self) -> str:
+        return 'Simulate a fleet of TVs on loopback addresses for testing without hardware.'
+
+    @property
+    def name(self) -> str:
+        return 'simulate'
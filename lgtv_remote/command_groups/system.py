@@ -1,11 +1,19 @@
 from argparse import Namespace
-from typing import Tuple, Dict, Optional
-
-from getmac import get_mac_address
-from wakeonlan import send_magic_packet
+from time import monotonic, sleep
+from typing import Tuple, Dict, List, Optional
 
+from lgtv_remote.adapter import WebOSClientAdapter
 from lgtv_remote.command import ControlCommandBase, CommandGroupBase, CommandBase
-from lgtv_remote.settings import SettingsInterface
+from lgtv_remote.exeception import ClientError
+from lgtv_remote.network import get_mac_address, get_broadcast_address, is_port_open
+from lgtv_remote.settings import SettingsInterface, TvSettings
+
+
+BROADCAST_ADDRESS = '255.255.255.255'
+WEBSOCKET_PORT = 3000
+RESEND_INTERVAL = 2
+MIN_PROBE_DELAY = 0.05
+MAX_PROBE_DELAY = 1
 
 
 class SystemCommandGroup(CommandGroupBase):
@@ -35,13 +43,10 @@ class NotifyCommand(ControlCommandBase):
             },
         )
 
-    def execute(self, namespace: Namespace):
-        name = namespace.name
-        path = namespace.config_path
+    def send(self, control, namespace: Namespace):
         message = namespace.message
 
-        control = self.create_control(path, name)
-        control.notify(message, block=True)
+        return control.notify(message, block=True)
 
     @property
     def help(self) -> str:
@@ -53,8 +58,9 @@ class NotifyCommand(ControlCommandBase):
 
 
 class PowerOnCommand(CommandBase):
-    def __init__(self, settings: SettingsInterface):
+    def __init__(self, settings: SettingsInterface, adapter: Optional[WebOSClientAdapter] = None):
         self.settings = settings
+        self.adapter = adapter
 
     @property
     def options(self) -> Tuple[Dict, ...]:
@@ -67,17 +73,80 @@ class PowerOnCommand(CommandBase):
                     'dest': 'name'
                 }
             },
+            {
+                'args': ('-w', '--wait'),
+                'kwargs': {
+                    'help': 'Keep waking the TV until it accepts a session, then report how long it took.',
+                    'action': 'store_true',
+                    'dest': 'wait'
+                }
+            },
+            {
+                'args': ('-t', '--timeout'),
+                'kwargs': {
+                    'help': 'Seconds to wait for the TV with --wait. Defaults to 60.',
+                    'default': 60,
+                    'type': float,
+                    'metavar': 'TIMEOUT',
+                    'dest': 'timeout'
+                }
+            },
         )
 
     def execute(self, namespace: Namespace):
+        from wakeonlan import send_magic_packet
+
         settings = self.settings
         name = namespace.name
         path = namespace.config_path
 
         settings.load(path)
         tv_settings = settings.get(name)
-
-        send_magic_packet(get_mac_address(ip=tv_settings.host))
+        mac_address = tv_settings.mac_address
+        broadcast_address = tv_settings.broadcast_address
+        if not mac_address:
+            mac_address = get_mac_address(tv_settings.host)
+            if not mac_address:
+                raise ClientError(f'Unable to find the MAC address of TV {tv_settings.host}. Please authenticate again '
+                                  f'while the TV is on.')
+            broadcast_address = broadcast_address or get_broadcast_address(tv_settings.host)
+            settings.set(name, tv_settings.host, tv_settings.client_key, mac_address, broadcast_address)
+            settings.serialize(path)
+
+        send_magic_packet(mac_address, ip_address=broadcast_address or BROADCAST_ADDRESS)
+        if namespace.wait:
+            elapsed = self.wait(namespace, tv_settings, mac_address, broadcast_address or BROADCAST_ADDRESS)
+            print(f'{name or tv_settings.host}: Ready in {elapsed:.2f}s')
+
+    def wait(self, namespace: Namespace, tv_settings: TvSettings, mac_address: str, broadcast_address: str) -> float:
+        from wakeonlan import send_magic_packet
+        from ws4py.exc import WebSocketException
+
+        adapter = self.adapter
+        host = tv_settings.host
+        start = monotonic()
+        deadline = start + namespace.timeout
+        next_packet = start + RESEND_INTERVAL
+        delay = MIN_PROBE_DELAY
+
+        while monotonic() < deadline:
+            if is_port_open(host, WEBSOCKET_PORT, min(delay * 4, MAX_PROBE_DELAY)):
+                if adapter is None:
+                    return monotonic() - start
+                try:
+                    timeout = max(deadline - monotonic(), MIN_PROBE_DELAY)
+                    client = adapter.connect(namespace.config_path, namespace.name, timeout)
+                    adapter.release(namespace.config_path, namespace.name, client)
+                    return monotonic() - start
+                except (OSError, RuntimeError, WebSocketException, ClientError):
+                    adapter.discard(namespace.config_path, namespace.name)
+            now = monotonic()
+            if now >= next_packet:
+                send_magic_packet(mac_address, ip_address=broadcast_address)
+                next_packet = now + RESEND_INTERVAL
+            sleep(max(0, min(delay, deadline - now)))
+            delay = min(delay * 2, MAX_PROBE_DELAY)
+        raise ClientError(f'TV {host} did not come up within {namespace.timeout:g}s.')
 
     @property
     def help(self) -> str:
@@ -89,12 +158,8 @@ class PowerOnCommand(CommandBase):
 
 
 class PowerOffCommand(ControlCommandBase):
-    def execute(self, namespace: Namespace):
-        name = namespace.name
-        path = namespace.config_path
-
-        control = self.create_control(path, name)
-        control.power_off(block=True)
+    def send(self, control, namespace: Namespace):
+        return control.power_off(block=True)
 
     @property
     def help(self) -> str:
@@ -106,14 +171,11 @@ class PowerOffCommand(ControlCommandBase):
 
 
 class InfoCommand(ControlCommandBase):
-    def execute(self, namespace: Namespace):
-        name = namespace.name
-        path = namespace.config_path
+    def send(self, control, namespace: Namespace):
+        return control.info(block=True)
 
-        control = self.create_control(path, name)
-        response = control.info(block=True)
-        for key, value in response.items():
-            print(key, ': ', value)
+    def format(self, response) -> List[str]:
+        return [f'{key} :  {value}' for key, value in response.items()]
 
     @property
     def help(self) -> str:
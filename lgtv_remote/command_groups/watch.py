@@ -0,0 +1,83 @@
+import json
+import sys
+from argparse import Namespace
+from typing import Tuple, Dict
+
+from lgtv_remote.adapter import WebOSClientAdapter
+from lgtv_remote.command import CommandBase
+from lgtv_remote.events import EventStream, SUBSCRIPTIONS
+from lgtv_remote.exeception import ClientError
+
+
+class WatchCommand(CommandBase):
+    def __init__(self, adapter: WebOSClientAdapter):
+        self.adapter = adapter
+
+    @property
+    def options(self) -> Tuple[Dict, ...]:
+        return (
+            {
+                'args': ('-n', '--name'),
+                'kwargs': {
+                    'help': 'The name of an authenticated TV, a group of TVs from your configuration file, or "all". '
+                            'Repeat this option or separate names with commas to watch several TVs.',
+                    'metavar': 'NAME',
+                    'dest': 'names',
+                    'action': 'append'
+                }
+            },
+            {
+                'args': ('-e', '--event'),
+                'kwargs': {
+                    'help': 'An event to watch. Repeat this option to watch several events. By default all events are '
+                            'watched.',
+                    'choices': tuple(SUBSCRIPTIONS),
+                    'dest': 'events',
+                    'action': 'append'
+                }
+            },
+            {
+                'args': ('-b', '--buffer-size'),
+                'kwargs': {
+                    'help': 'The maximum number of events held while output is blocked. The oldest events are dropped '
+                            'first. Defaults to 1024.',
+                    'metavar': 'BUFFER_SIZE',
+                    'dest': 'buffer_size',
+                    'type': int,
+                    'default': 1024
+                }
+            }
+        )
+
+    def execute(self, namespace: Namespace):
+        adapter = self.adapter
+        path = namespace.config_path
+        events = namespace.events or list(SUBSCRIPTIONS)
+
+        stream = EventStream(namespace.buffer_size)
+        clients = []
+        try:
+            for name in adapter.resolve(path, namespace.names):
+                client = adapter.connect(path, name)
+                clients.append((name, client))
+                stream.subscribe(client, name, events)
+            while True:
+                record = stream.get(1)
+                if record is not None:
+                    sys.stdout.write(json.dumps(record) + '\n')
+                    sys.stdout.flush()
+                elif stream.closed:
+                    break
+        finally:
+            stream.close()
+            for name, client in clients:
+                adapter.release(path, name, client)
+        raise ClientError('Connection to TV closed.')
+
+    @property
+    def help(self) -> str:
+        return 'Print volume, foreground app and power state changes as newline-delimited JSON.'
+
+    @property
+    def name(self) -> str:
+        return 'watch'
@@ -0,0 +1,87 @@
+import json
+import os
+from pathlib import Path
+from queue import Empty
+from socketserver import ThreadingUnixStreamServer, StreamRequestHandler
+from typing import Dict
+
+from lgtv_remote.adapter import PooledWebOSClientAdapter
+from lgtv_remote.exeception import ClientError
+
+
+SOCKET_ENVIRONMENT_VARIABLE = 'LGTV_REMOTE_SOCKET'
+DEFAULT_SOCKET_PATH = Path(os.environ.get(SOCKET_ENVIRONMENT_VARIABLE) or Path().home() / '.lgtv.sock')
+
+
+class DaemonRequestHandler(StreamRequestHandler):
+    def handle(self):
+        daemon: Daemon = self.server.daemon
+
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+            except ValueError:
+                request = None
+            if isinstance(request, dict):
+                response = daemon.handle(request)
+            else:
+                response = {'error': 'Invalid request.'}
+            self.wfile.write(json.dumps(response).encode() + b'\n')
+            self.wfile.flush()
+
+
+class DaemonServer(ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, daemon: 'Daemon'):
+        self.daemon = daemon
+        super().__init__(socket_path, DaemonRequestHandler)
+
+
+class Daemon:
+    def __init__(self, adapter: PooledWebOSClientAdapter, timeout: float = 60):
+        self.adapter = adapter
+        self.timeout = timeout
+
+    def serve(self, socket_path: str):
+        socket_path = str(socket_path)
+
+        if Path(socket_path).exists():
+            os.unlink(socket_path)
+        server = DaemonServer(socket_path, self)
+        os.chmod(socket_path, 0o600)
+        self.adapter.pool.start()
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+            os.unlink(socket_path)
+            self.adapter.close()
+
+    def handle(self, request: Dict) -> Dict:
+        adapter = self.adapter
+        path = request.get('config_path')
+        friendly_name = request.get('name')
+
+        try:
+            try:
+                message = self._send(path, friendly_name, request)
+            except (OSError, RuntimeError):
+                adapter.discard(path, friendly_name)
+                message = self._send(path, friendly_name, request)
+        except Exception as e:
+            return {'error': str(e) or type(e).__name__}
+        return {'message': message}
+
+    def _send(self, path: str, friendly_name: str, request: Dict) -> Dict:
+        adapter = self.adapter
+
+        client = adapter.connect(path, friendly_name)
+        try:
+            queue = client.send_message(request.get('type', 'request'), request.get('uri'), request.get('payload'),
+                                        get_queue=True)
+            return queue.get(timeout=self.timeout, block=True)
+        except Empty:
+            raise ClientError(f'Timed out waiting for a response to {request.get("uri")}.') from None
+        finally:
+            adapter.release(path, friendly_name, client)
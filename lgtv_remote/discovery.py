@@ -0,0 +1,180 @@
+import asyncio
+import json
+import os
+import socket
+from pathlib import Path
+from time import time
+from typing import Callable, Optional, Dict, List
+from urllib.parse import urlparse
+
+from lgtv_remote.network import get_interface_addresses
+
+
+SSDP_GROUP = ('239.255.255.250', 1900)
+SSDP_SERVICE = 'urn:schemas-upnp-org:device:MediaRenderer:1'
+SSDP_KEYWORD = b'LG'
+DEFAULT_CACHE_PATH = str(Path.home() / '.lgtv.discovery')
+DEFAULT_CACHE_TTL = 300
+
+
+def read_location(data: bytes) -> Optional[str]:
+    for line in data.decode('utf-8', 'replace').splitlines():
+        header, _, value = line.partition(':')
+        if header.strip().lower() == 'location':
+            return value.strip()
+    return None
+
+
+class SsdpProtocol(asyncio.DatagramProtocol):
+    def __init__(self, on_location: Callable[[str], None]):
+        self.on_location = on_location
+
+    def datagram_received(self, data: bytes, addr):
+        location = read_location(data)
+        if location:
+            self.on_location(location)
+
+
+async def fetch(url: str, timeout: float = 5) -> bytes:
+    parsed = urlparse(url)
+    if not parsed.hostname:
+        raise ValueError(f'Invalid URL "{url}".')
+    path = parsed.path or '/'
+    if parsed.query:
+        path = f'{path}?{parsed.query}'
+
+    reader, writer = await asyncio.wait_for(asyncio.open_connection(parsed.hostname, parsed.port or 80), timeout)
+    try:
+        writer.write(f'GET {path} HTTP/1.0\r\nHost: {parsed.netloc}\r\nConnection: close\r\n\r\n'.encode('ascii'))
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), timeout)
+    finally:
+        writer.close()
+    _, _, body = response.partition(b'\r\n\r\n')
+    return body
+
+
+async def validate_location(location: str, keyword: bytes = SSDP_KEYWORD, timeout: float = 5) -> bool:
+    try:
+        return keyword in await fetch(location, timeout)
+    except (OSError, ValueError, asyncio.TimeoutError):
+        return False
+
+
+def parse_description(body: bytes) -> Dict[str, str]:
+    from xml.etree.ElementTree import fromstring, ParseError
+
+    try:
+        root = fromstring(body)
+    except ParseError:
+        return {}
+    description = {}
+    for element in root.iter():
+        if element.tag.rpartition('}')[2] == 'device':
+            for child in element:
+                key = child.tag.rpartition('}')[2]
+                if child.text and child.text.strip() and key not in description:
+                    description[key] = child.text.strip()
+            break
+    return description
+
+
+async def describe(location: str, timeout: float = 5) -> Dict[str, str]:
+    try:
+        return parse_description(await fetch(location, timeout))
+    except (OSError, ValueError, asyncio.TimeoutError):
+        return {}
+
+
+def create_search_message(service: str = SSDP_SERVICE, mx: int = 3) -> bytes:
+    return '\r\n'.join([
+        'M-SEARCH * HTTP/1.1',
+        f'HOST: {SSDP_GROUP[0]}:{SSDP_GROUP[1]}',
+        'MAN: "ssdp:discover"',
+        f'ST: {service}',
+        f'MX: {mx}',
+        '',
+        ''
+    ]).encode('ascii')
+
+
+async def create_search_endpoint(address: str, on_location: Callable[[str], None]) -> asyncio.DatagramTransport:
+    transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+        lambda: SsdpProtocol(on_location),
+        family=socket.AF_INET,
+        local_addr=(address, 0)
+    )
+    udp_socket = transport.get_extra_info('socket')
+    udp_socket.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 2)
+    if address != '0.0.0.0':
+        udp_socket.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(address))
+    return transport
+
+
+async def discover(
+        timeout: float = 5,
+        retries: int = 3,
+        keyword: bytes = SSDP_KEYWORD,
+        on_host: Optional[Callable[[str, str], None]] = None,
+        addresses: Optional[List[str]] = None
+) -> Dict[str, str]:
+    hosts = {}
+    locations = set()
+    validations = []
+
+    async def validate(location: str):
+        if not await validate_location(location, keyword, timeout):
+            return
+        host = urlparse(location).hostname
+        if host not in hosts:
+            hosts[host] = location
+            on_host and on_host(host, location)
+
+    def on_location(location: str):
+        if location not in locations:
+            locations.add(location)
+            validations.append(asyncio.ensure_future(validate(location)))
+
+    transports = []
+    for address in addresses or get_interface_addresses() or ['0.0.0.0']:
+        try:
+            transports.append(await create_search_endpoint(address, on_location))
+        except OSError:
+            continue
+    try:
+        message = create_search_message()
+        for _ in range(retries):
+            for transport in transports:
+                transport.sendto(message, SSDP_GROUP)
+            await asyncio.sleep(timeout / retries)
+    finally:
+        for transport in transports:
+            transport.close()
+    await asyncio.gather(*validations)
+    return hosts
+
+
+class DiscoveryCache:
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: float = DEFAULT_CACHE_TTL):
+        self.path = path
+        self.ttl = ttl
+
+    def get(self) -> Optional[Dict[str, str]]:
+        try:
+            with open(self.path, 'r') as file_object:
+                cache = json.load(file_object)
+            if time() - cache['time'] > self.ttl:
+                return None
+            return dict(cache['hosts'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def set(self, hosts: Dict[str, str]):
+        temporary_path = f'{self.path}.{os.getpid()}'
+        try:
+            file_descriptor = os.open(temporary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(file_descriptor, 'w') as file_object:
+                json.dump({'time': time(), 'hosts': hosts}, file_object)
+            os.replace(temporary_path, self.path)
+        except OSError:
+            pass
@@ -0,0 +1,77 @@
+from collections import deque
+from threading import Condition
+from time import time
+from typing import Deque, Dict, List, Optional, Tuple, TYPE_CHECKING
+from uuid import uuid4
+
+if TYPE_CHECKING:
+    from pywebostv.connection import WebOSClient
+
+
+SUBSCRIPTIONS = {
+    'volume': 'ssap://audio/getVolume',
+    'app': 'ssap://com.webos.applicationManager/getForegroundAppInfo',
+    'power': 'ssap://com.webos.service.tvpower/power/getPowerState'
+}
+IGNORED_KEYS = ('returnValue', 'subscribed')
+
+
+class EventStream:
+    def __init__(self, max_size: int = 1024):
+        self._events: Deque[Dict] = deque(maxlen=max(max_size, 1))
+        self._condition = Condition()
+        self._subscriptions: List[Tuple['WebOSClient', str]] = []
+        self._dropped = 0
+
+    @property
+    def closed(self) -> bool:
+        return all(client.terminated for client, _ in self._subscriptions)
+
+    def subscribe(self, client: 'WebOSClient', name: Optional[str], events: List[str]):
+        for event in events:
+            unique_id = str(uuid4())
+            client.subscribe(SUBSCRIPTIONS[event], unique_id, self._create_callback(name, event))
+            self._subscriptions.append((client, unique_id))
+
+    def put(self, record: Dict):
+        events = self._events
+
+        with self._condition:
+            if len(events) == events.maxlen:
+                self._dropped += 1
+            events.append(record)
+            self._condition.notify()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Dict]:
+        events = self._events
+
+        with self._condition:
+            if not events and not self._dropped:
+                self._condition.wait(timeout)
+            if self._dropped:
+                dropped, self._dropped = self._dropped, 0
+                return {'time': time(), 'event': 'dropped', 'count': dropped}
+            return events.popleft() if events else None
+
+    def close(self):
+        subscriptions = self._subscriptions
+
+        for client, unique_id in subscriptions:
+            if not client.terminated:
+                try:
+                    client.unsubscribe(unique_id)
+                except (OSError, RuntimeError, ValueError):
+                    pass
+        subscriptions.clear()
+
+    def _create_callback(self, name: Optional[str], event: str):
+        def callback(payload: Optional[Dict]):
+            payload = payload or {}
+            record = {'time': time(), 'name': name, 'event': event}
+            if payload.get('returnValue') is False:
+                record['error'] = payload.get('errorText', 'Unknown Communication Error')
+            else:
+                record['payload'] = {key: value for key, value in payload.items() if key not in IGNORED_KEYS}
+            self.put(record)
+
+        return callback
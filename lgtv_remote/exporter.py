@@ -0,0 +1,154 @@
+import asyncio
+import random
+from time import monotonic
+from typing import Dict, List, Optional
+
+from lgtv_remote.aio import AsyncWebOSClientAdapter
+
+
+VOLUME_URI = 'ssap://audio/getVolume'
+APP_URI = 'ssap://com.webos.applicationManager/getForegroundAppInfo'
+POWER_URI = 'ssap://com.webos.service.tvpower/power/getPowerState'
+METRICS = (
+    ('lgtv_up', 'gauge', 'Whether the last poll of the TV succeeded.'),
+    ('lgtv_power_on', 'gauge', 'Whether the TV screen is on.'),
+    ('lgtv_volume', 'gauge', 'The volume of the TV.'),
+    ('lgtv_muted', 'gauge', 'Whether the TV is muted.'),
+    ('lgtv_foreground_app_info', 'gauge', 'The app in the foreground of the TV.'),
+    ('lgtv_request_latency_seconds', 'gauge', 'The latency of the last request to the TV.'),
+    ('lgtv_poll_duration_seconds', 'gauge', 'The duration of the last poll of the TV.'),
+    ('lgtv_connect_failures_total', 'counter', 'The number of failed connections to the TV.'),
+    ('lgtv_request_failures_total', 'counter', 'The number of failed requests to the TV.')
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+class TvMetrics:
+    def __init__(self, name: str):
+        self.name = name
+        self.samples: Dict[str, Dict[str, float]] = {}
+        self.connect_failures = 0
+        self.request_failures = 0
+
+    def set(self, metric: str, value: float, **labels: str):
+        label_text = ''.join(f',{key}="{_escape(str(label))}"' for key, label in labels.items())
+        self.samples.setdefault(metric, {})[f'{{name="{_escape(self.name)}"{label_text}}}'] = float(value)
+
+    def clear(self, metric: str):
+        self.samples.pop(metric, None)
+
+
+class Exporter:
+    def __init__(
+            self,
+            adapter: AsyncWebOSClientAdapter,
+            path: str,
+            names: List[str],
+            interval: float = 15,
+            timeout: float = 5
+    ):
+        self.adapter = adapter
+        self.path = path
+        self.interval = interval
+        self.timeout = timeout
+        self._metrics = {name: TvMetrics(name) for name in names}
+        self._body = b''
+        self._dirty = True
+
+    async def serve(self, host: str = '127.0.0.1', port: int = 9823):
+        self._render()
+        server = await asyncio.start_server(self._handle, host, port)
+        tasks = [asyncio.ensure_future(self._poll(metrics)) for metrics in self._metrics.values()]
+        tasks.append(asyncio.ensure_future(self._render_periodically()))
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.adapter.close()
+
+    async def _poll(self, metrics: TvMetrics):
+        adapter = self.adapter
+        path = self.path
+        name = metrics.name
+        timeout = self.timeout
+
+        await asyncio.sleep(random.uniform(0, self.interval))
+        while True:
+            start = monotonic()
+            try:
+                client = await asyncio.wait_for(adapter.create(path, name), timeout)
+            except Exception:
+                metrics.connect_failures += 1
+                metrics.set('lgtv_up', 0)
+                await adapter.discard(path, name)
+            else:
+                try:
+                    for uri in (POWER_URI, VOLUME_URI, APP_URI):
+                        request_start = monotonic()
+                        response = await client.request(uri, timeout=timeout)
+                        metrics.set('lgtv_request_latency_seconds', monotonic() - request_start, uri=uri)
+                        self._update(metrics, uri, response.get('payload') or {})
+                    metrics.set('lgtv_up', 1)
+                except Exception:
+                    metrics.request_failures += 1
+                    metrics.set('lgtv_up', 0)
+                    await adapter.discard(path, name)
+            metrics.set('lgtv_poll_duration_seconds', monotonic() - start)
+            metrics.set('lgtv_connect_failures_total', metrics.connect_failures)
+            metrics.set('lgtv_request_failures_total', metrics.request_failures)
+            self._dirty = True
+            await asyncio.sleep(max(self.interval - (monotonic() - start), 0))
+
+    @staticmethod
+    def _update(metrics: TvMetrics, uri: str, payload: Dict):
+        if uri == POWER_URI:
+            metrics.set('lgtv_power_on', payload.get('state', 'Active') == 'Active')
+        elif uri == VOLUME_URI:
+            status = payload.get('volumeStatus', payload)
+            if 'volume' in status:
+                metrics.set('lgtv_volume', status['volume'])
+            if 'muteStatus' in status or 'muted' in status:
+                metrics.set('lgtv_muted', bool(status.get('muteStatus', status.get('muted'))))
+        elif uri == APP_URI and payload.get('appId'):
+            metrics.clear('lgtv_foreground_app_info')
+            metrics.set('lgtv_foreground_app_info', 1, app_id=payload['appId'])
+
+    async def _render_periodically(self):
+        while True:
+            await asyncio.sleep(1)
+            if self._dirty:
+                self._render()
+
+    def _render(self):
+        self._dirty = False
+        lines = []
+        for metric, metric_type, help_text in METRICS:
+            lines.append(f'# HELP {metric} {help_text}')
+            lines.append(f'# TYPE {metric} {metric_type}')
+            for metrics in self._metrics.values():
+                for labels, value in metrics.samples.get(metric, {}).items():
+                    lines.append(f'{metric}{labels} {value!r}')
+        self._body = ('\n'.join(lines) + '\n').encode()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            header = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), self.timeout)
+            parts = header.split(b'\r\n', 1)[0].split()
+            path: Optional[bytes] = parts[1] if len(parts) > 1 else None
+            if path is not None and path.split(b'?')[0] == b'/metrics':
+                status, content_type, body = b'200 OK', b'text/plain; version=0.0.4', self._body
+            else:
+                status, content_type, body = b'404 Not Found', b'text/plain', b'Not Found\n'
+            writer.write(b'HTTP/1.1 %s\r\nContent-Type: %s\r\nContent-Length: %d\r\nConnection: close\r\n\r\n'
+                         % (status, content_type, len(body)) + body)
+            await writer.drain()
+        except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError):
+            pass
+        finally:
+            writer.close()
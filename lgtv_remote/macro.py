@@ -0,0 +1,99 @@
+import re
+from time import monotonic, sleep
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Union
+
+from lgtv_remote.exeception import ClientError
+
+
+DURATION_PATTERN = re.compile(r'^\s*(\d+(?:\.\d*)?|\.\d+)\s*(ms|s)?\s*$')
+BUTTON_ALIASES = {
+    'one': 'num_1',
+    'two': 'num_2',
+    'three': 'num_3',
+    'four': 'num_4',
+    'five': 'num_5',
+    'six': 'num_6',
+    'seven': 'num_7',
+    'eight': 'num_8',
+    'nine': 'num_9',
+    'zero': 'num_0'
+}
+
+
+class MacroStep(NamedTuple):
+    button: str
+    delay: float
+    payload: str
+
+
+def parse_duration(value: Union[str, float], require_unit: bool = False) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        if require_unit:
+            raise ValueError(f'Duration "{value}" needs a unit, such as {value}ms or {value}s.')
+        seconds = float(value)
+    else:
+        match = DURATION_PATTERN.match(str(value))
+        if match is None:
+            raise ValueError(f'Invalid duration "{value}".')
+        if require_unit and match.group(2) is None:
+            raise ValueError(f'Duration "{value}" needs a unit, such as {match.group(1)}ms or {match.group(1)}s.')
+        seconds = float(match.group(1)) / (1000 if match.group(2) == 'ms' else 1)
+    if seconds < 0:
+        raise ValueError(f'Invalid duration "{value}".')
+    return seconds
+
+
+def compile_button(button: str) -> str:
+    from pywebostv.controls import InputControl, process_payload
+
+    command = InputControl.INPUT_COMMANDS.get(BUTTON_ALIASES.get(button, button))
+    if command is None:
+        raise ClientError(f'Unknown button "{button}".')
+    try:
+        params = process_payload(command['command'])
+    except TypeError:
+        raise ClientError(f'"{button}" is not a button.') from None
+    return '\n'.join(':'.join(str(y) for y in x) for x in params) + '\n\n'
+
+
+def compile_macro(name: str, steps: List[Union[str, Dict]], interval: float = 0) -> List[MacroStep]:
+    payloads: Dict[str, str] = {}
+    compiled = []
+
+    for index, step in enumerate(steps, 1):
+        if isinstance(step, str):
+            button, delay = step, None
+        elif isinstance(step, dict) and isinstance(step.get('button'), str):
+            button, delay = step['button'], step.get('delay')
+        else:
+            raise ClientError(f'Step {index} of macro "{name}" must be a button or a mapping with a button.')
+        try:
+            delay = (interval if compiled else 0) if delay is None else parse_duration(delay, require_unit=True)
+        except ValueError as e:
+            raise ClientError(f'Step {index} of macro "{name}": {e}') from None
+        if button not in payloads:
+            payloads[button] = compile_button(button)
+        compiled.append(MacroStep(button, delay, payloads[button]))
+    return compiled
+
+
+def play(steps: List[MacroStep], send: Callable[[str], None]):
+    deadline = monotonic()
+    for step in steps:
+        deadline += step.delay
+        remaining = deadline - monotonic()
+        if remaining > 0:
+            sleep(remaining)
+        send(step.payload)
+
+
+async def play_async(steps: List[MacroStep], send: Callable[[str], Awaitable[None]]):
+    import asyncio
+
+    deadline = monotonic()
+    for step in steps:
+        deadline += step.delay
+        remaining = deadline - monotonic()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+        await send(step.payload)
@@ -1,23 +1,27 @@
 from sys import argv
 
-from pywebostv.controls import MediaControl, SystemControl, InputControl
-
+from lgtv_remote.timings import Timings
 from lgtv_remote.client import Client
 from lgtv_remote.command import RootCommandGroup
 from lgtv_remote.command_groups.connect import ConnectCommandGroup, AuthenticateCommand, DiscoverCommand, \
     SendCommand
-from lgtv_remote.adapter import WebOSClientAdapter
+from lgtv_remote.adapter import PooledWebOSClientAdapter
+from lgtv_remote.command_groups.daemon import DaemonCommand
+from lgtv_remote.command_groups.exporter import ExporterCommand
+from lgtv_remote.command_groups.run import RunCommand
+from lgtv_remote.command_groups.simulate import SimulateCommand
+from lgtv_remote.command_groups.watch import WatchCommand
+from lgtv_remote.daemon import DEFAULT_SOCKET_PATH
 from lgtv_remote.command_groups.media import MediaCommandGroup, VolumeUpCommand, VolumeDownCommand, GetVolumeCommand, SetVolumeCommand, \
     MuteCommand, UnmuteCommand, PlayCommand, PauseCommand, StopCommand, RewindCommand, FastForwardCommand
-from lgtv_remote.command_groups.input import InputCommandGroup, CaptureMouseCommand, CaptureKeyboardCommand
+from lgtv_remote.command_groups.input import InputCommandGroup, CaptureMouseCommand, CaptureKeyboardCommand, \
+    TypeCommand, MacroCommand, KeysCommand
 from lgtv_remote.settings import Settings
 from lgtv_remote.command_groups.system import SystemCommandGroup, NotifyCommand, PowerOnCommand, PowerOffCommand, InfoCommand
 
 
-def main():
-    settings = Settings()
-    adapter = WebOSClientAdapter(settings)
-    Client(
+def create_client(settings: Settings, adapter: PooledWebOSClientAdapter, timings: Timings) -> Client:
+    return Client(
         RootCommandGroup(
             (
                 ConnectCommandGroup(
@@ -37,47 +41,47 @@ def main():
                     (
                         VolumeUpCommand(
                             adapter,
-                            MediaControl
+                            'MediaControl'
                         ),
                         VolumeDownCommand(
                             adapter,
-                            MediaControl
+                            'MediaControl'
                         ),
                         GetVolumeCommand(
                             adapter,
-                            MediaControl
+                            'MediaControl'
                         ),
                         SetVolumeCommand(
                             adapter,
-                            MediaControl
+                            'MediaControl'
                         ),
                         MuteCommand(
                             adapter,
-                            MediaControl
+                            'MediaControl'
                         ),
                         UnmuteCommand(
                             adapter,
-                            MediaControl
+                            'MediaControl'
                         ),
                         PlayCommand(
                             adapter,
-                            MediaControl
+                            'MediaControl'
                         ),
                         PauseCommand(
                             adapter,
-                            MediaControl
+                            'MediaControl'
                         ),
                         StopCommand(
                             adapter,
-                            MediaControl
+                            'MediaControl'
                         ),
                         RewindCommand(
                             adapter,
-                            MediaControl
+                            'MediaControl'
                         ),
                         FastForwardCommand(
                             adapter,
-                            MediaControl
+                            'MediaControl'
                         )
                     )
                 ),
@@ -85,18 +89,19 @@ def main():
                     (
                         NotifyCommand(
                             adapter,
-                            SystemControl
+                            'SystemControl'
                         ),
                         PowerOnCommand(
-                            settings
+                            settings,
+                            adapter
                         ),
                         PowerOffCommand(
                             adapter,
-                            SystemControl
+                            'SystemControl'
                         ),
                         InfoCommand(
                             adapter,
-                            SystemControl
+                            'SystemControl'
                         )
                     )
                 ),
@@ -104,19 +109,56 @@ def main():
                     (
                         CaptureMouseCommand(
                             adapter,
-                            InputControl
+                            'InputControl'
                         ),
                         CaptureKeyboardCommand(
                             adapter,
-                            InputControl
+                            'InputControl'
+                        ),
+                        TypeCommand(
+                            adapter,
+                            'InputControl'
+                        ),
+                        MacroCommand(
+                            adapter,
+                            'InputControl'
+                        ),
+                        KeysCommand(
+                            adapter,
+                            'InputControl'
                         )
                     ),
                     adapter,
-                    InputControl
+                    'InputControl'
+                ),
+                DaemonCommand(
+                    PooledWebOSClientAdapter(settings)
+                ),
+                RunCommand(),
+                WatchCommand(
+                    adapter
+                ),
+                ExporterCommand(
+                    settings
+                ),
+                SimulateCommand(
+                    settings
                 )
             )
-        )
-    ).run(argv[1:])
+        ),
+        timings
+    )
+
+
+def main():
+    settings = Settings()
+    timings = Timings()
+    adapter = PooledWebOSClientAdapter(settings, DEFAULT_SOCKET_PATH, timings=timings)
+    client = create_client(settings, adapter, timings)
+    try:
+        client.run(argv[1:])
+    finally:
+        adapter.close()
 
 
 if __name__ == '__main__':
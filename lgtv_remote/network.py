@@ -0,0 +1,62 @@
+import socket
+import struct
+from ipaddress import IPv4Network
+from typing import Optional, List, Tuple
+
+
+SIOCGIFADDR = 0x8915
+SIOCGIFNETMASK = 0x891b
+
+
+def get_mac_address(host: str) -> Optional[str]:
+    from getmac import get_mac_address as get_mac
+
+    return get_mac(ip=host)
+
+
+def is_port_open(host: str, port: int, timeout: float = 0.5) -> bool:
+    try:
+        with socket.create_connection((host, port), timeout):
+            return True
+    except OSError:
+        return False
+
+
+def get_local_address(host: str) -> str:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as udp_socket:
+        udp_socket.connect((host, 9))
+        return udp_socket.getsockname()[0]
+
+
+def get_interfaces() -> List[Tuple[str, str]]:
+    interfaces = []
+    try:
+        import fcntl
+
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as udp_socket:
+            for _, name in socket.if_nameindex():
+                request = struct.pack('256s', name.encode()[:15])
+                try:
+                    address = socket.inet_ntoa(fcntl.ioctl(udp_socket.fileno(), SIOCGIFADDR, request)[20:24])
+                    netmask = socket.inet_ntoa(fcntl.ioctl(udp_socket.fileno(), SIOCGIFNETMASK, request)[20:24])
+                except OSError:
+                    continue
+                interfaces.append((address, netmask))
+    except (ImportError, OSError):
+        pass
+    return interfaces
+
+
+def get_interface_addresses() -> List[str]:
+    return [address for address, _ in get_interfaces() if not address.startswith('127.')]
+
+
+def get_broadcast_address(host: str) -> Optional[str]:
+    try:
+        local_address = get_local_address(host)
+        for address, netmask in get_interfaces():
+            if address == local_address:
+                return str(IPv4Network(f'{address}/{netmask}', strict=False).broadcast_address)
+    except (OSError, ValueError):
+        pass
+    return None
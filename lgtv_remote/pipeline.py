@@ -0,0 +1,90 @@
+from itertools import count
+from threading import Condition
+from typing import Callable, Dict, List, Optional, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pywebostv.controls import WebOSControlBase
+
+
+class Pipeline:
+    def __init__(self):
+        self._pending: Dict[int, str] = {}
+        self._errors: List[str] = []
+        self._condition = Condition()
+        self._counter = count()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def track(self, label: str, on_result: Optional[Callable[[Any], None]] = None) -> Callable[[bool, Any], None]:
+        condition = self._condition
+        pending = self._pending
+
+        with condition:
+            key = next(self._counter)
+            pending[key] = label
+
+        def callback(status: bool, result: Any):
+            with condition:
+                if pending.pop(key, None) is None:
+                    return
+                if not status:
+                    self._errors.append(f'{label}: {result}')
+                condition.notify_all()
+            if status and on_result is not None and result is not None:
+                on_result(result)
+
+        return callback
+
+    def wait(self, timeout: float = 60) -> List[str]:
+        condition = self._condition
+
+        with condition:
+            condition.wait_for(lambda: not self._pending, timeout)
+            errors = self._errors + [f'{label}: No response from TV.' for label in self._pending.values()]
+            self._errors = []
+            self._pending.clear()
+        return errors
+
+
+class PipelinedControl:
+    def __init__(
+            self,
+            control: 'WebOSControlBase',
+            pipeline: Pipeline,
+            label: str,
+            on_result: Optional[Callable[[Any], None]] = None
+    ):
+        self._control = control
+        self._pipeline = pipeline
+        self._label = label
+        self._on_result = on_result
+
+    def __getattr__(self, name: str):
+        from pywebostv.controls import process_payload
+
+        control = self._control
+        if name not in control.COMMANDS:
+            return getattr(control, name)
+        command_info = control.COMMANDS[name]
+
+        def request(*args, **kwargs):
+            kwargs.pop('block', None)
+            kwargs.pop('timeout', None)
+            params = process_payload(command_info.get('payload'), *args, **kwargs)
+            callback = self._pipeline.track(self._label, self._on_result)
+
+            def on_response(response: Dict):
+                if response.get('type') == 'error':
+                    callback(False, response.get('error', 'Unknown Communication Error'))
+                    return
+                payload = response.get('payload')
+                status, message = command_info.get('validation', lambda p: (True, None))(payload)
+                if not status:
+                    callback(False, message)
+                    return
+                callback(True, command_info.get('return', lambda p: p)(payload))
+
+            control.request(command_info['uri'], params, callback=on_response)
+
+        return request
@@ -0,0 +1,153 @@
+from collections import OrderedDict
+from queue import Empty
+from threading import RLock, Lock, Thread, Event
+from time import monotonic
+from typing import Callable, Tuple, Optional, Dict, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pywebostv.connection import WebOSClient
+
+
+PING_URI = 'ssap://com.webos.service.tvpower/power/getPowerState'
+
+
+class PooledSession:
+    def __init__(self, client: 'WebOSClient'):
+        self.client = client
+        self.last_used = monotonic()
+        self.last_checked = self.last_used
+        self.users = 0
+
+    @property
+    def idle(self) -> float:
+        return monotonic() - self.last_used
+
+    def touch(self):
+        self.last_used = monotonic()
+        self.last_checked = self.last_used
+
+
+class WebOSClientPool:
+    def __init__(self, max_size: int = 16, max_idle: float = 300, keepalive: float = 30, ping_timeout: float = 5):
+        self.max_size = max_size
+        self.max_idle = max_idle
+        self.keepalive = keepalive
+        self.ping_timeout = ping_timeout
+        self._sessions: 'OrderedDict[Tuple, PooledSession]' = OrderedDict()
+        self._creating: Dict[Tuple, Lock] = {}
+        self._lock = RLock()
+        self._stopped = Event()
+        self._thread: Optional[Thread] = None
+
+    def acquire(self, key: Tuple, factory: Callable[[], 'WebOSClient']) -> 'WebOSClient':
+        with self._lock:
+            creating = self._creating.setdefault(key, Lock())
+        with creating:
+            session = self._get(key)
+            if session is not None and self._is_healthy(session):
+                with self._lock:
+                    session.users += 1
+                    session.touch()
+                return session.client
+            self.discard(key)
+            client = factory()
+            session = PooledSession(client)
+            session.users = 1
+            self._put(key, session)
+            return client
+
+    def release(self, key: Tuple, client: 'WebOSClient'):
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None or session.client is not client or not session.users:
+                return
+            session.users -= 1
+            session.touch()
+            evicted = self._evict()
+        for session in evicted:
+            self._close(session)
+
+    def discard(self, key: Tuple):
+        with self._lock:
+            session = self._sessions.pop(key, None)
+        if session is not None:
+            self._close(session)
+
+    def start(self):
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = Thread(target=self._run, name='lgtv-remote-pool', daemon=True)
+            self._thread.start()
+
+    def close(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            sessions = tuple(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            self._close(session)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _get(self, key: Tuple) -> Optional[PooledSession]:
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                self._sessions.move_to_end(key)
+            return session
+
+    def _put(self, key: Tuple, session: PooledSession):
+        with self._lock:
+            sessions = self._sessions
+            sessions[key] = session
+            sessions.move_to_end(key)
+            evicted = self._evict()
+        for session in evicted:
+            self._close(session)
+
+    def _evict(self) -> List[PooledSession]:
+        sessions = self._sessions
+        excess = len(sessions) - self.max_size
+        if excess <= 0:
+            return []
+        keys = [key for key, session in sessions.items() if not session.users][:excess]
+        return [sessions.pop(key) for key in keys]
+
+    def _is_healthy(self, session: PooledSession) -> bool:
+        if session.client.terminated or (not session.users and session.idle > self.max_idle):
+            return False
+        if monotonic() - session.last_checked < self.keepalive:
+            return True
+        return self._ping(session)
+
+    def _ping(self, session: PooledSession) -> bool:
+        try:
+            queue = session.client.send_message('request', PING_URI, None, get_queue=True)
+            queue.get(timeout=self.ping_timeout, block=True)
+        except (Empty, OSError, RuntimeError):
+            return False
+        session.last_checked = monotonic()
+        return True
+
+    def _run(self):
+        while not self._stopped.wait(self.keepalive):
+            with self._lock:
+                items = tuple(self._sessions.items())
+            for key, session in items:
+                if session.client.terminated or (not session.users and session.idle > self.max_idle):
+                    self.discard(key)
+                elif monotonic() - session.last_checked >= self.keepalive and not self._ping(session):
+                    self.discard(key)
+
+    @staticmethod
+    def _close(session: PooledSession):
+        client = session.client
+        if not client.terminated:
+            try:
+                client.close()
+            except (OSError, RuntimeError):
+                pass
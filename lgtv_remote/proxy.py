@@ -0,0 +1,63 @@
+import json
+import socket
+from queue import Queue
+from threading import RLock
+from typing import Optional, Dict, Callable
+
+from lgtv_remote.exeception import ClientError
+
+
+class DaemonClient:
+    def __init__(self, socket_path: str, path: str, friendly_name: Optional[str]):
+        self.path = str(path)
+        self.friendly_name = friendly_name
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.connect(str(socket_path))
+        self._file = self._socket.makefile('rwb')
+        self._lock = RLock()
+
+    def send_message(
+            self,
+            request_type: str,
+            uri: Optional[str],
+            payload: Optional[Dict],
+            unique_id: Optional[str] = None,
+            get_queue: bool = False,
+            callback: Optional[Callable] = None
+    ) -> Optional[Queue]:
+        message = self._request(
+            {
+                'config_path': self.path,
+                'name': self.friendly_name,
+                'type': request_type,
+                'uri': uri,
+                'payload': payload
+            }
+        )
+        if get_queue:
+            queue = Queue()
+            queue.put(message)
+            return queue
+        if callback is not None:
+            callback(message)
+
+    def close(self):
+        self._file.close()
+        self._socket.close()
+
+    def _request(self, request: Dict) -> Dict:
+        file_object = self._file
+
+        with self._lock:
+            try:
+                file_object.write(json.dumps(request).encode() + b'\n')
+                file_object.flush()
+                line = file_object.readline()
+            except OSError as e:
+                raise ClientError(f'Lost connection to lgtv-remote daemon: {e}') from None
+        if not line:
+            raise ClientError('Lost connection to lgtv-remote daemon.')
+        response = json.loads(line)
+        if 'error' in response:
+            raise ClientError(response['error'])
+        return response['message']
@@ -1,12 +1,20 @@
+import json
+import os
 from abc import ABC, abstractmethod
-from typing import NamedTuple
+from typing import NamedTuple, List, Dict, Optional, Tuple, Any
 
-from yaml import safe_load, safe_dump
+from lgtv_remote.exeception import ClientError
+
+
+CACHE_VERSION = 2
+MACROS_KEY = 'macros'
 
 
 class TvSettings(NamedTuple):
     host: str
     client_key: str
+    mac_address: Optional[str] = None
+    broadcast_address: Optional[str] = None
 
 
 class SettingsInterface(ABC):
@@ -18,29 +26,184 @@ class SettingsInterface(ABC):
     def load(self, path: str):
         raise NotImplementedError
 
+    @abstractmethod
+    def resolve(self, names: List[str]) -> List[str]:
+        raise NotImplementedError
+
     @abstractmethod
     def serialize(self, path: str):
         raise NotImplementedError
 
     @abstractmethod
-    def set(self, key: str, host: str, client_key: str):
+    def set(
+            self,
+            key: str,
+            host: str,
+            client_key: str,
+            mac_address: Optional[str] = None,
+            broadcast_address: Optional[str] = None
+    ):
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_group(self, key: str, names: List[str]):
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_macro(self, key: str) -> List:
         raise NotImplementedError
 
 
 class Settings(SettingsInterface):
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
+        self.use_cache = use_cache
         self._settings = {}
+        self._path: Optional[str] = None
+        self._signature: Optional[Tuple[int, int]] = None
+        self._index: Optional[Dict[str, List]] = None
+        self._index_size = 0
 
     def get(self, key: str) -> TvSettings:
-        return TvSettings(**self._settings.get(key))
+        value = self._lookup(key)
+        if not isinstance(value, dict) or key == MACROS_KEY:
+            raise ClientError(f'No authenticated TV named "{key}". Please authenticate with your TV.')
+        return TvSettings(**value)
 
     def load(self, path: str):
-        with open(path, 'r') as file_object:
-            self._settings = safe_load(file_object)
+        path = str(path)
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        if path == self._path and signature == self._signature:
+            return
+        self._path = path
+        self._signature = signature
+        self._settings = {}
+        self._index = None
+        if self.use_cache:
+            self._index, self._index_size = self._read_index(path, signature)
+        if self._index is None:
+            self._settings = self._parse(path)
+            self.use_cache and self._write_cache(path, signature)
+
+    def resolve(self, names: List[str]) -> List[str]:
+        resolved = []
+
+        for name in [name for value in names for name in value.split(',') if name]:
+            if name == 'all':
+                targets = self._names()
+            elif isinstance(self._lookup(name), list):
+                targets = self._lookup(name)
+            else:
+                targets = [name]
+            resolved.extend(target for target in targets if target not in resolved)
+        return resolved
 
     def serialize(self, path: str):
+        from yaml import dump
+
+        self._load_all()
         with open(path, 'w') as file_object:
-            safe_dump(self._settings, file_object)
+            dump(self._settings, file_object, Dumper=_get_yaml_class('Dumper'))
+
+    def set(
+            self,
+            key: str,
+            host: str,
+            client_key: str,
+            mac_address: Optional[str] = None,
+            broadcast_address: Optional[str] = None
+    ):
+        self._load_all()
+        value = {'host': host, 'client_key': client_key}
+        if mac_address:
+            value['mac_address'] = mac_address
+        if broadcast_address:
+            value['broadcast_address'] = broadcast_address
+        self._settings[key] = value
+
+    def set_group(self, key: str, names: List[str]):
+        self._load_all()
+        self._settings[key] = list(names)
+
+    def get_macro(self, key: str) -> List:
+        macros = self._lookup(MACROS_KEY)
+        macro = macros.get(key) if isinstance(macros, dict) else None
+        if not isinstance(macro, list):
+            raise ClientError(f'No macro named "{key}" in your configuration file.')
+        return macro
+
+    def _names(self) -> List[str]:
+        index = self._index
+        if index is not None:
+            return [key for key, (_, _, is_tv) in index.items() if is_tv]
+        return [key for key, value in self._settings.items() if isinstance(value, dict) and key != MACROS_KEY]
+
+    def _lookup(self, key: str) -> Any:
+        settings = self._settings
+        index = self._index
+
+        if key not in settings and index is not None and key in index:
+            offset, length, _ = index[key]
+            with open(self._get_cache_path(self._path), 'rb') as file_object:
+                file_object.seek(self._index_size + offset)
+                settings[key] = json.loads(file_object.read(length))
+        return settings.get(key)
+
+    def _load_all(self):
+        if self._index is not None:
+            for key in self._index:
+                self._lookup(key)
+            self._index = None
+
+    @staticmethod
+    def _parse(path: str) -> Dict:
+        from yaml import load
+
+        with open(path, 'r') as file_object:
+            return load(file_object, Loader=_get_yaml_class('Loader')) or {}
+
+    @staticmethod
+    def _get_cache_path(path: str) -> str:
+        return f'{path}.cache'
+
+    def _read_index(self, path: str, signature: Tuple[int, int]) -> Tuple[Optional[Dict[str, List]], int]:
+        try:
+            with open(self._get_cache_path(path), 'rb') as file_object:
+                line = file_object.readline()
+                header = json.loads(line)
+        except (OSError, ValueError):
+            return None, 0
+        if header.get('version') != CACHE_VERSION or tuple(header.get('signature', ())) != signature:
+            return None, 0
+        return header.get('index'), len(line)
+
+    def _write_cache(self, path: str, signature: Tuple[int, int]):
+        try:
+            records = [(str(key), json.dumps(value).encode()) for key, value in self._settings.items()]
+        except (TypeError, ValueError):
+            return
+        index = {}
+        offset = 0
+        for key, record in records:
+            index[key] = [offset, len(record), record.startswith(b'{') and key != MACROS_KEY]
+            offset += len(record) + 1
+        header = json.dumps({'version': CACHE_VERSION, 'signature': signature, 'index': index}).encode() + b'\n'
+
+        cache_path = self._get_cache_path(path)
+        temporary_path = f'{cache_path}.{os.getpid()}'
+        try:
+            file_descriptor = os.open(temporary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(file_descriptor, 'wb') as file_object:
+                file_object.write(header)
+                for _, record in records:
+                    file_object.write(record + b'\n')
+            os.replace(temporary_path, cache_path)
+        except OSError:
+            pass
+
+
+def _get_yaml_class(kind: str):
+    import yaml
 
-    def set(self, key: str, host: str, client_key: str):
-        self._settings[key] = {'host': host, 'client_key': client_key}
+    return getattr(yaml, f'CSafe{kind}', None) or getattr(yaml, f'Safe{kind}')
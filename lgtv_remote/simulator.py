@@ -0,0 +1,320 @@
+import asyncio
+import json
+import random
+import re
+import socket
+from ipaddress import IPv4Address
+from typing import Dict, List, Optional, Tuple, Callable
+
+from lgtv_remote.discovery import SSDP_GROUP, SSDP_SERVICE
+
+
+DEFAULT_CLIENT_KEY = 'lgtv-remote-simulator'
+WEBSOCKET_PORT = 3000
+DESCRIPTION_PORT = 3100
+MAX_SSDP_DELAY = 1
+VOLUME_URI = 'ssap://audio/getVolume'
+APP_URI = 'ssap://com.webos.applicationManager/getForegroundAppInfo'
+POWER_URI = 'ssap://com.webos.service.tvpower/power/getPowerState'
+
+
+class FakeTv:
+    def __init__(
+            self,
+            host: str = '127.0.0.1',
+            port: int = WEBSOCKET_PORT,
+            latency: float = 0,
+            client_key: str = DEFAULT_CLIENT_KEY,
+            jitter: float = 0,
+            failure_rate: float = 0,
+            drop_rate: float = 0,
+            pairing_delay: float = 1,
+            description_port: Optional[int] = None,
+            friendly_name: Optional[str] = None
+    ):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.client_key = client_key
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.drop_rate = drop_rate
+        self.pairing_delay = pairing_delay
+        self.description_port = description_port
+        self.friendly_name = friendly_name or f'[LG] webOS TV {host}'
+        self.state = {'volume': 10, 'muted': False, 'app': 'com.webos.app.livetv', 'power': 'Active'}
+        self.requests = 0
+        self.registrations = 0
+        self.input_messages = 0
+        self._subscriptions: Dict[str, List[Tuple[object, str]]] = {}
+        self._server = None
+        self._description_server: Optional[asyncio.AbstractServer] = None
+        self._handlers: Dict[str, Callable[[Dict], Optional[Dict]]] = {
+            VOLUME_URI: self._get_volume,
+            'ssap://audio/setVolume': self._set_volume,
+            'ssap://audio/volumeUp': lambda payload: self._set_volume({'volume': self.state['volume'] + 1}),
+            'ssap://audio/volumeDown': lambda payload: self._set_volume({'volume': self.state['volume'] - 1}),
+            'ssap://audio/setMute': self._set_mute,
+            APP_URI: lambda payload: {'appId': self.state['app']},
+            'ssap://system.launcher/launch': self._launch,
+            POWER_URI: lambda payload: {'state': self.state['power']},
+            'ssap://system/turnOff': self._turn_off,
+            'ssap://com.webos.service.update/getCurrentSWInformation': lambda payload: {
+                'product_name': 'webOSTV 6.0',
+                'model_name': 'HE_DTV_W21O_AFABATAA',
+                'sw_type': 'FIRMWARE',
+                'major_ver': '03',
+                'minor_ver': '21.30',
+                'device_id': self.host
+            },
+            'ssap://system.notifications/createToast': lambda payload: {'toastId': '1'},
+            'ssap://com.webos.service.networkinput/getPointerInputSocket': lambda payload: {
+                'socketPath': f'ws://{self.host}:{self.port}/input'
+            },
+            'ssap://com.webos.service.ime/insertText': lambda payload: {},
+            'ssap://com.webos.service.ime/deleteCharacters': lambda payload: {},
+            'ssap://com.webos.service.ime/sendEnterKey': lambda payload: {},
+            **{f'ssap://media.controls/{action}': lambda payload: {}
+               for action in ('play', 'pause', 'stop', 'rewind', 'fastForward')}
+        }
+
+    @property
+    def location(self) -> str:
+        return f'http://{self.host}:{self.description_port}/description.xml'
+
+    @property
+    def description(self) -> bytes:
+        return (
+            '<?xml version="1.0"?>'
+            '<root xmlns="urn:schemas-upnp-org:device-1-0"><device>'
+            f'<deviceType>{SSDP_SERVICE}</deviceType>'
+            f'<friendlyName>{self.friendly_name}</friendlyName>'
+            '<manufacturer>LG Electronics</manufacturer>'
+            '<modelName>LG TV</modelName>'
+            f'<UDN>uuid:lgtv-remote-simulator-{self.host}</UDN>'
+            '</device></root>'
+        ).encode()
+
+    async def start(self):
+        from websockets import serve
+
+        self._server = await serve(self._handle, self.host, self.port, compression=None, ping_interval=None)
+        if self.description_port is not None:
+            self._description_server = await asyncio.start_server(
+                self._handle_description,
+                self.host,
+                self.description_port
+            )
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._description_server is not None:
+            self._description_server.close()
+            await self._description_server.wait_closed()
+            self._description_server = None
+
+    async def _handle_description(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        body = self.description
+        try:
+            await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), 5)
+            writer.write(
+                b'HTTP/1.1 200 OK\r\nContent-Type: text/xml\r\nContent-Length: %d\r\nConnection: close\r\n\r\n'
+                % len(body) + body
+            )
+            await writer.drain()
+        except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle(self, connection):
+        from websockets.exceptions import ConnectionClosed
+
+        request = getattr(connection, 'request', None)
+        path = request.path if request is not None else getattr(connection, 'path', '/')
+
+        try:
+            if path == '/input':
+                async for _ in connection:
+                    self.input_messages += 1
+                return
+            async for data in connection:
+                try:
+                    message = json.loads(data)
+                except ValueError:
+                    continue
+                if message.get('type') == 'register':
+                    await self._register(connection, message)
+                elif message.get('type') in ('request', 'subscribe'):
+                    asyncio.ensure_future(self._respond(connection, message))
+        except (OSError, ConnectionClosed):
+            pass
+        finally:
+            for subscribers in self._subscriptions.values():
+                subscribers[:] = [subscriber for subscriber in subscribers if subscriber[0] is not connection]
+
+    async def _register(self, connection, message: Dict):
+        self.registrations += 1
+        await asyncio.sleep(self._get_latency())
+        if (message.get('payload') or {}).get('client-key') != self.client_key:
+            await connection.send(json.dumps({
+                'type': 'response',
+                'id': message.get('id'),
+                'payload': {'pairingType': 'PROMPT', 'returnValue': True}
+            }))
+            await asyncio.sleep(self.pairing_delay)
+        await connection.send(json.dumps({
+            'type': 'registered',
+            'id': message.get('id'),
+            'payload': {'client-key': self.client_key}
+        }))
+
+    async def _respond(self, connection, message: Dict):
+        uri = message.get('uri')
+        handler = self._handlers.get(uri)
+
+        self.requests += 1
+        await asyncio.sleep(self._get_latency())
+        if self.drop_rate and random.random() < self.drop_rate:
+            await connection.close()
+            return
+        if handler is None:
+            response = {'type': 'error', 'id': message.get('id'), 'error': '404 no such service or method',
+                        'payload': {}}
+        elif self.failure_rate and random.random() < self.failure_rate:
+            response = {'type': 'error', 'id': message.get('id'), 'error': '500 simulated failure', 'payload': {}}
+        else:
+            payload = handler(message.get('payload') or {}) or {}
+            response = {'type': 'response', 'id': message.get('id'), 'payload': {'returnValue': True, **payload}}
+            if message.get('type') == 'subscribe':
+                response['payload']['subscribed'] = True
+                self._subscriptions.setdefault(uri, []).append((connection, message.get('id')))
+        try:
+            await connection.send(json.dumps(response))
+        except Exception:
+            pass
+
+    def _get_latency(self) -> float:
+        return self.latency + (random.uniform(0, self.jitter) if self.jitter else 0)
+
+    def _publish(self, uri: str):
+        subscribers = self._subscriptions.get(uri, ())
+        if not subscribers:
+            return
+        payload = {'returnValue': True, 'subscribed': True, **self._handlers[uri]({})}
+        for connection, unique_id in tuple(subscribers):
+            message = json.dumps({'type': 'response', 'id': unique_id, 'payload': payload})
+            asyncio.ensure_future(connection.send(message))
+
+    def _get_volume(self, payload: Dict) -> Dict:
+        state = self.state
+
+        return {
+            'scenario': 'mastervolume_tv_speaker',
+            'volume': state['volume'],
+            'muted': state['muted'],
+            'volumeStatus': {'volume': state['volume'], 'muteStatus': state['muted']}
+        }
+
+    def _set_volume(self, payload: Dict) -> Dict:
+        self.state['volume'] = max(0, min(100, int(payload.get('volume', self.state['volume']))))
+        self._publish(VOLUME_URI)
+        return {}
+
+    def _set_mute(self, payload: Dict) -> Dict:
+        self.state['muted'] = bool(payload.get('mute'))
+        self._publish(VOLUME_URI)
+        return {}
+
+    def _launch(self, payload: Dict) -> Dict:
+        self.state['app'] = payload.get('id', self.state['app'])
+        self._publish(APP_URI)
+        return {'id': self.state['app']}
+
+    def _turn_off(self, payload: Dict) -> Dict:
+        self.state['power'] = 'Suspend'
+        self._publish(POWER_URI)
+        return {}
+
+
+class SsdpResponder(asyncio.DatagramProtocol):
+    def __init__(self, tvs: List[FakeTv]):
+        self.tvs = tvs
+        self.transport: Optional[asyncio.DatagramTransport] = None
+
+    def connection_made(self, transport: asyncio.DatagramTransport):
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr):
+        text = data.decode('utf-8', 'replace')
+        if not text.startswith('M-SEARCH') or (SSDP_SERVICE not in text and 'ssdp:all' not in text):
+            return
+        match = re.search(r'^MX:\s*(\d+)', text, re.IGNORECASE | re.MULTILINE)
+        spread = min(int(match.group(1)), MAX_SSDP_DELAY) if match else MAX_SSDP_DELAY
+        loop = asyncio.get_running_loop()
+        for tv in self.tvs:
+            loop.call_later(random.uniform(0, spread), self._reply, tv, addr)
+
+    def _reply(self, tv: FakeTv, addr):
+        if self.transport is None or self.transport.is_closing():
+            return
+        self.transport.sendto('\r\n'.join([
+            'HTTP/1.1 200 OK',
+            'CACHE-CONTROL: max-age=1800',
+            'EXT:',
+            f'LOCATION: {tv.location}',
+            'SERVER: WebOS/1.5 UPnP/1.0 lgtv-remote-simulator',
+            f'ST: {SSDP_SERVICE}',
+            f'USN: uuid:lgtv-remote-simulator-{tv.host}::{SSDP_SERVICE}',
+            '',
+            ''
+        ]).encode(), addr)
+
+
+class Simulator:
+    def __init__(self, count: int, base_address: str = '127.0.1.1', ssdp: bool = True, **options):
+        base = IPv4Address(base_address)
+        self.tvs = [
+            FakeTv(str(base + index), description_port=DESCRIPTION_PORT, **options) for index in range(count)
+        ]
+        self.ssdp = ssdp
+        self._transport: Optional[asyncio.DatagramTransport] = None
+
+    async def start(self):
+        await asyncio.gather(*(tv.start() for tv in self.tvs))
+        if self.ssdp:
+            self._transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+                lambda: SsdpResponder(self.tvs),
+                sock=self._create_ssdp_socket()
+            )
+
+    async def close(self):
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+        await asyncio.gather(*(tv.close() for tv in self.tvs), return_exceptions=True)
+
+    async def serve(self):
+        await self.start()
+        try:
+            await asyncio.Future()
+        finally:
+            await self.close()
+
+    @staticmethod
+    def _create_ssdp_socket() -> socket.socket:
+        udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, 'SO_REUSEPORT'):
+            udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        udp_socket.bind(('', SSDP_GROUP[1]))
+        udp_socket.setsockopt(
+            socket.IPPROTO_IP,
+            socket.IP_ADD_MEMBERSHIP,
+            socket.inet_aton(SSDP_GROUP[0]) + socket.inet_aton('0.0.0.0')
+        )
+        udp_socket.setblocking(False)
+        return udp_socket
@@ -0,0 +1,65 @@
+import subprocess
+import sys
+from argparse import ArgumentParser
+from typing import Dict, List, Tuple, Optional
+
+
+DEFAULT_MODULE = 'lgtv_remote.main'
+DEFAULT_BUDGET_MS = 50
+DEFERRED_MODULES = ('pynput', 'tkinter', 'getmac', 'wakeonlan', 'pywebostv', 'yaml')
+
+
+def measure(module: str = DEFAULT_MODULE) -> Dict[str, int]:
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        stderr=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        universal_newlines=True
+    )
+    if process.returncode:
+        raise RuntimeError(f'Importing {module} failed:\n{process.stderr}')
+    timings = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        timings[name.strip()] = int(cumulative)
+    return timings
+
+
+def check(
+        module: str = DEFAULT_MODULE,
+        budget_ms: float = DEFAULT_BUDGET_MS,
+        repeat: int = 1,
+        deferred: Tuple[str, ...] = DEFERRED_MODULES
+) -> List[str]:
+    timings = min((measure(module) for _ in range(repeat)), key=lambda t: t.get(module, 0))
+    errors = []
+    total_ms = timings.get(module, 0) / 1000
+    if total_ms > budget_ms:
+        errors.append(f'Importing {module} took {total_ms:.1f}ms, over the {budget_ms:.1f}ms budget.')
+    for name in timings:
+        if name.split('.')[0] in deferred:
+            errors.append(f'Importing {module} eagerly imported {name}.')
+    return errors
+
+
+def main(args: Optional[List[str]] = None):
+    parser = ArgumentParser(
+        description='Fail when the cold import time of the lgtv-remote entry point exceeds a budget.',
+        prog='python -m lgtv_remote.startup'
+    )
+    parser.add_argument('-m', '--module', default=DEFAULT_MODULE, metavar='MODULE')
+    parser.add_argument('-b', '--budget-ms', default=DEFAULT_BUDGET_MS, type=float, metavar='BUDGET_MS')
+    parser.add_argument('-r', '--repeat', default=3, type=int, metavar='REPEAT',
+                        help='Measure this many times and keep the best run.')
+    namespace = parser.parse_args(args)
+
+    errors = check(namespace.module, namespace.budget_ms, namespace.repeat)
+    for error in errors:
+        print('Error: ', error)
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == '__main__':
+    main()
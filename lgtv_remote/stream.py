@@ -0,0 +1,163 @@
+from abc import ABC, abstractmethod
+from collections import deque
+from threading import Lock, Event, Thread
+from typing import NamedTuple, Deque, Tuple, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pywebostv.controls import WebOSControlBase
+
+
+class InputStreamStats(NamedTuple):
+    received: int
+    sent: int
+    merged: int
+    dropped: int
+    queue_depth: int
+
+
+class InputStreamBase(ABC):
+    def __init__(self, input_control: 'WebOSControlBase', interval: float):
+        self._input_control = input_control
+        self._interval = interval
+        self._events: Deque[Tuple] = deque()
+        self._lock = Lock()
+        self._wake = Event()
+        self._stopped = Event()
+        self._thread: Optional[Thread] = None
+        self._pending = 0
+        self._received = 0
+        self._sent = 0
+        self._merged = 0
+        self._dropped = 0
+
+    @property
+    def stats(self) -> InputStreamStats:
+        with self._lock:
+            return InputStreamStats(
+                self._received,
+                self._sent,
+                self._merged,
+                self._dropped,
+                len(self._events) + bool(self._pending)
+            )
+
+    def start(self):
+        self._stopped.clear()
+        self._thread = Thread(target=self._run, name=f'lgtv-remote-{type(self).__name__}', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wake.wait(self._interval)
+            self._wake.clear()
+            self._flush()
+        self._flush()
+
+    def _flush(self):
+        with self._lock:
+            self._seal()
+            events = tuple(self._events)
+            self._events.clear()
+        for event in events:
+            try:
+                self._send(event)
+            except Exception:
+                with self._lock:
+                    self._dropped += 1
+            else:
+                with self._lock:
+                    self._sent += 1
+
+    def _seal(self):
+        pass
+
+    @abstractmethod
+    def _send(self, event: Tuple):
+        raise NotImplementedError
+
+
+class PointerStream(InputStreamBase):
+    def __init__(self, input_control: 'WebOSControlBase', rate: float = 60):
+        super().__init__(input_control, 1 / rate)
+        self._dx = 0.0
+        self._dy = 0.0
+
+    def move(self, dx: float, dy: float):
+        with self._lock:
+            self._dx += dx
+            self._dy += dy
+            self._pending += 1
+            self._received += 1
+
+    def click(self):
+        with self._lock:
+            self._seal()
+            self._events.append(('click',))
+            self._received += 1
+        self._wake.set()
+
+    def _seal(self):
+        dx = int(self._dx)
+        dy = int(self._dy)
+        if dx or dy:
+            self._events.append(('move', dx, dy))
+            self._dx -= dx
+            self._dy -= dy
+            self._merged += self._pending - 1
+            self._pending = 0
+
+    def _send(self, event: Tuple):
+        input_control = self._input_control
+
+        if event[0] == 'move':
+            input_control.move(event[1], event[2])
+        else:
+            input_control.click()
+
+
+class TextStream(InputStreamBase):
+    def __init__(self, input_control: 'WebOSControlBase', interval: float = 0.03, chunk_size: int = 64):
+        super().__init__(input_control, interval)
+        self._chunk_size = chunk_size
+
+    def type(self, text: str):
+        self._append('type', text)
+
+    def delete(self, count: int = 1):
+        self._append('delete', count)
+
+    def enter(self):
+        with self._lock:
+            self._events.append(('enter',))
+            self._received += 1
+
+    def _append(self, kind: str, value):
+        events = self._events
+
+        with self._lock:
+            if events and events[-1][0] == kind:
+                events[-1] = (kind, events[-1][1] + value)
+                self._merged += 1
+            else:
+                events.append((kind, value))
+            self._received += 1
+
+    def _send(self, event: Tuple):
+        input_control = self._input_control
+        chunk_size = self._chunk_size
+
+        if event[0] == 'type':
+            text = event[1]
+            for start in range(0, len(text), chunk_size):
+                input_control.type(text[start:start + chunk_size], block=True)
+        elif event[0] == 'delete':
+            input_control.delete(event[1], block=True)
+        else:
+            input_control.enter(block=True)
@@ -0,0 +1,57 @@
+import json
+from contextlib import contextmanager
+from threading import Lock, local
+from time import perf_counter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+STARTED = perf_counter()
+
+
+class Timings:
+    def __init__(self, origin: float = STARTED):
+        self.origin = origin
+        self._phases: Dict[Tuple[str, Optional[str]], List[float]] = {}
+        self._lock = Lock()
+        self._local = local()
+
+    @contextmanager
+    def phase(self, name: str, tv: Optional[str] = None) -> Iterator[None]:
+        stack = self._local.__dict__.setdefault('stack', [])
+        stack.append(0.0)
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = perf_counter() - start
+            self.add(name, elapsed - stack.pop(), tv)
+            if stack:
+                stack[-1] += elapsed
+
+    def add(self, name: str, seconds: float, tv: Optional[str] = None):
+        with self._lock:
+            phase = self._phases.setdefault((name, tv), [0, 0.0])
+            phase[0] += 1
+            phase[1] += seconds
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            phases = [
+                {'phase': name, 'tv': tv, 'count': count, 'seconds': seconds}
+                for (name, tv), (count, seconds) in self._phases.items()
+            ]
+        return {'total_seconds': perf_counter() - self.origin, 'phases': phases}
+
+    def format(self, output_format: str = 'text') -> str:
+        timings = self.to_dict()
+        if output_format == 'json':
+            return json.dumps(timings)
+        rows = [('PHASE', 'TV', 'COUNT', 'MS')]
+        for phase in timings['phases']:
+            rows.append((phase['phase'], phase['tv'] or '', str(phase['count']), f'{phase["seconds"] * 1000:.1f}'))
+        rows.append(('total', '', '', f'{timings["total_seconds"] * 1000:.1f}'))
+        widths = [max(len(row[index]) for row in rows) for index in range(4)]
+        return '\n'.join(
+            f'{row[0].ljust(widths[0])}  {row[1].ljust(widths[1])}  {row[2].rjust(widths[2])}  '
+            f'{row[3].rjust(widths[3])}' for row in rows
+        )